@@ -1,5 +1,6 @@
 
 import os
+from types import MappingProxyType
 
 from utils.config.get_config import get_config as config
 from logger.logger import Logger
@@ -35,14 +36,18 @@ US_STATE_CODES = [
     "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
     "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
 ]
+US_STATE_CODES_LOWER = tuple(code.lower() for code in US_STATE_CODES)
 
-LEGAL_WEBSITE_DICT = {
+_LEGAL_WEBSITE_DICT = {
     "american_legal": {
         "base_url": "https://codelibrary.amlegal.com/regions/",
         "target_class": "browse-link roboto",
         "wait_in_seconds": 5,
         "robots_txt": "https://codelibrary.amlegal.com/robots.txt",
         "source": "american_legal",
+        "scrape_url_length": 42,
+        "lowercase_state_code": True,
+        "ready_selector": "a.browse-link.roboto", # Wait for this to be on the page before getting its links.
     },
     "municode": {
         "base_url": "https://library.municode.com/",
@@ -50,6 +55,9 @@ LEGAL_WEBSITE_DICT = {
         "wait_in_seconds": 15,
         "robots_txt": "https://municode.com/robots.txt",
         "source": "municode",
+        "scrape_url_length": 31,
+        "lowercase_state_code": True,
+        "ready_selector": "a.index-link", # Wait for this to be on the page before getting its links.
     },
     "general_code" : {
         "base_url": "https://www.generalcode.com/source-library/?state=",
@@ -57,8 +65,15 @@ LEGAL_WEBSITE_DICT = {
         "wait_in_seconds": 0,
         "robots_txt": "https://www.generalcode.com/robots.txt",
         "source": "general_code",
+        "scrape_url_length": 52,
+        "lowercase_state_code": False,
+        "ready_selector": "a.codeLink", # Wait for this to be on the page before getting its links.
     },
 }
+# NOTE The site dictionaries are read-only, so they're frozen to keep scrapers from changing them for each other.
+LEGAL_WEBSITE_DICT = MappingProxyType({
+    site: MappingProxyType(site_dict) for site, site_dict in _LEGAL_WEBSITE_DICT.items()
+})
 
 
 # def find_project_root(current_path: str=None, marker: str='.project_root'):
@@ -96,6 +111,7 @@ try:
     SKIP_STEPS: bool = config(path, 'SKIP_STEPS') or True
     ROUTE: str = config(path, 'ROUTE') or "NA"
     CONCURRENCY_LIMIT: int = config(path, 'CONCURRENCY_LIMIT') or 2
+    MAX_OPEN_PAGES: int = config(path, 'MAX_OPEN_PAGES') or 6
     FILENAME_PREFIX: str = config(path, 'FILENAME_PREFIX') or "scrape_the_law"
     WAIT_TIME: int = config(path, 'WAIT_TIME') or 0
     DATAPOINT: str = config(path, 'DATAPOINT') or "sales tax"
@@ -181,12 +197,16 @@ try:
     DATABASE_NAME: str = config(path, 'DATABASE_NAME') or ""
     MYSQL_SCRIPT_FILE_PATH: str = config(path, 'MYSQL_SCRIPT_FILE_PATH') or ""
     INSERT_BATCH_SIZE: int = config(path, 'INSERT_BATCH_SIZE') or 1000
+    LOAD_DATA_THRESHOLD: int = config(path, 'LOAD_DATA_THRESHOLD') or 100000
     RAND_SEED: int = config(path, 'RAND_SEED') or 420
 
     # PLAYWRIGHT
     path = "PLAYWRIGHT"
     HEADLESS: bool = config(path, 'HEADLESS') or True
     SLOW_MO: int = config(path, 'SLOW_MO') or 0 # NO BREAKS ON THIS TRAIN!
+    CDP_ENDPOINT: str = config(path, 'CDP_ENDPOINT') or None # e.g. 'http://localhost:9222'. If set, connect to this Chromium instead of launching one.
+    CDP_PORT: int = config(path, 'CDP_PORT') or 9222 # The port manual/start_browser_server.py opens the CDP endpoint on.
+    BROWSER_USER_DATA_DIR: str = config(path, 'BROWSER_USER_DATA_DIR') or os.path.join(script_dir, "browser_profile")
 
     # PRIVATE PATH FOLDERS
     path = "PRIVATE_FOLDER_PATHS"
@@ -1,6 +1,11 @@
 import asyncio
+from collections.abc import Iterable, Sequence, Sized
 from contextlib import contextmanager, asynccontextmanager
+import csv
+import itertools
+import os
 import re
+import tempfile
 import time
 import traceback
 from typing import Any, AsyncGenerator, LiteralString, Generator
@@ -22,7 +27,7 @@ from aiomysql.connection import Connection as AioMySqlConnection
 from aiomysql.cursors import Cursor as AioMySQLCursor
 
 
-from config.config import HOST, USER, PORT, PASSWORD, MYSQL_SCRIPT_FILE_PATH, DATABASE_NAME, INSERT_BATCH_SIZE
+from config.config import HOST, USER, PORT, PASSWORD, MYSQL_SCRIPT_FILE_PATH, DATABASE_NAME, INSERT_BATCH_SIZE, LOAD_DATA_THRESHOLD
 from logger.logger import Logger
 log_level = 10
 logger = Logger(logger_name=__name__, log_level=log_level)
@@ -36,6 +41,40 @@ from utils.shared.make_id import make_id
 # If a MySQL command starts with SELECT, SHOW, WITH, or EXPLAIN, it's a query.
 QUERY_PATTERN = re.compile(r"^(SELECT|SHOW|WITH|EXPLAIN)\b", re.IGNORECASE) 
 
+# Progress logging for async_insert_by_batch. Log every N batches or every T seconds, whichever comes first.
+INSERT_LOG_EVERY_N_BATCHES = 100
+INSERT_LOG_INTERVAL_IN_SECONDS = 10.0
+
+# Number of rows fetched from the server at a time when streaming a query into DataFrames.
+QUERY_CHUNK_SIZE = 10000
+
+# Rough cap on the size of one multi-row INSERT statement, so it stays under the server's max_allowed_packet.
+# NOTE 4 MiB is the MySQL 5.7 default. 8.0 defaults to 64 MiB.
+MAX_INSERT_STATEMENT_BYTES = 4 * 1024 * 1024
+
+# Session settings for bulk loads. They're set on the connection for the load, then put back before it returns to the pool.
+# NOTE unique_checks is left on, since upserts rely on ON DUPLICATE KEY UPDATE catching duplicates.
+BULK_LOAD_SESSION_SETTINGS = {
+    "foreign_key_checks": 0,
+    "bulk_insert_buffer_size": 256 * 1024 * 1024,
+}
+
+LOAD_DATA_STATEMENT = """
+LOAD DATA LOCAL INFILE %s INTO TABLE {table}
+FIELDS TERMINATED BY ',' ENCLOSED BY '"' LINES TERMINATED BY '\\n'
+IGNORE 0 LINES ({columns});
+"""
+
+# NOTE LOAD DATA can't do ON DUPLICATE KEY UPDATE, so upserts are loaded into a temporary table first,
+# then merged into the real table with a single INSERT ... SELECT.
+CREATE_TEMP_TABLE_STATEMENT = "CREATE TEMPORARY TABLE {temp_table} LIKE {table};"
+DROP_TEMP_TABLE_STATEMENT = "DROP TEMPORARY TABLE IF EXISTS {temp_table};"
+UPSERT_FROM_TEMP_TABLE_STATEMENT = """
+INSERT INTO {table} ({columns})
+SELECT {columns} FROM {temp_table}
+ON DUPLICATE KEY UPDATE {update};
+"""
+
 class MySqlDatabase:
     """
     TODO Update docstring for MySqlDatabase
@@ -214,7 +253,8 @@ class MySqlDatabase:
                 user=self.db_config['user'],
                 port=self.db_config['port'],
                 password=self.db_config['password'],
-                db=self.db_config['database']
+                db=self.db_config['database'],
+                local_infile=True # Needed for LOAD DATA LOCAL INFILE in async_insert_by_batch.
             )
             logger.debug("async MySQL server connection pool was successfully created.")
         except aiomysql.Error as e:
@@ -253,6 +293,50 @@ class MySqlDatabase:
             raise ConnectionError(f"No available connections in the pool: {e}") from e
 
 
+    @asynccontextmanager
+    async def _async_pool_acquire(self) -> AsyncGenerator[AioMySqlConnection, None]:
+        """
+        Get a connection from the async connection pool, and always return it to the pool afterwards,
+        even if an exception was raised while using it.
+
+        Yields:
+            AioMySqlConnection: A pooled connection to the MySQL server.
+        """
+        connection: AioMySqlConnection = await self._async_get_connection_from_pool()
+        try:
+            yield connection
+        finally:
+            self._return_connection_to_pool(connection)
+
+
+    @asynccontextmanager
+    async def _async_bulk_load_session(self, connection: AioMySqlConnection, enabled: bool=True) -> AsyncGenerator[None, None]:
+        """
+        Apply BULK_LOAD_SESSION_SETTINGS to a connection, and restore its previous settings afterwards,
+        so they don't carry over to whatever uses the connection next.
+
+        Args:
+            connection (AioMySqlConnection): The connection the bulk load runs on.
+            enabled (bool, optional): If False, do nothing. Defaults to True.
+        """
+        if not enabled:
+            yield
+            return
+
+        names = list(BULK_LOAD_SESSION_SETTINGS)
+        async with connection.cursor() as cursor:
+            await cursor.execute("SELECT " + ", ".join(f"@@SESSION.{name}" for name in names))
+            previous_values = await cursor.fetchone()
+            await cursor.execute(
+                "SET " + ", ".join(f"SESSION {name} = %s" for name in names), tuple(BULK_LOAD_SESSION_SETTINGS.values())
+            )
+        try:
+            yield
+        finally:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SET " + ", ".join(f"SESSION {name} = %s" for name in names), previous_values)
+
+
     def _return_connection_to_pool(self, 
                                    connection: aiomysql.connection.Connection | PooledMySQLConnection
                                   ) -> None:
@@ -357,7 +441,6 @@ class MySqlDatabase:
 
         if not command:
             logger.error("No SQL statement provided.")
-            self._return_connection_to_pool(connection)
             raise ValueError("No SQL statement provided.")
 
         if params: # Determine what type 'params' is, record it, and modify it accordingly
@@ -375,7 +458,6 @@ class MySqlDatabase:
                 params = params if isinstance(params[0], tuple) else [tuple(item.values()) if type(item) is dict else item for item in params]
                 assert type(params[0]) is tuple, f"params[0] is not a tuple, but a {type(params[0])}"
             else:
-                self._return_connection_to_pool(connection)
                 logger.error("Argument 'params' must be type tuple, dict, list[tuple], or list[dict]")
                 raise TypeError("Argument 'params' must be type tuple, dict, list[tuple], or list[dict]")
 
@@ -561,9 +643,9 @@ class MySqlDatabase:
             if not is_query:
                 await connection.rollback() # Rollback the database if there's an error altering it.
 
-            # Shutdown the connection immediately if there's an error.
+            # Shutdown the cursor immediately if there's an error.
+            # NOTE The connection itself is returned to the pool by whoever acquired it.
             await cursor.close()
-            self._return_connection_to_pool(connection)
             traceback.print_exc()
             raise e
 
@@ -590,17 +672,14 @@ class MySqlDatabase:
                 args=args, unbuffered=unbuffered, return_dict=return_dict, size=size
             )
             for row in cursor:
-                print(row)
                 yield row
         finally:
             cursor.close()
             self._return_connection_to_pool(connection)
 
-    @asynccontextmanager
     async def _async_execute_unbuffered_query(self,
                                     command: LiteralString,
                                     params: (tuple[Any,...] | list[tuple[Any,...]]) = None,
-                                    connection: aiomysql.Connection=None,
                                     is_query:bool=True,
                                     args: dict=None,
                                     unbuffered: bool=True,
@@ -611,11 +690,12 @@ class MySqlDatabase:
         Asynchronously cxecute an unbuffered SQL query and yield results asynchronously.
 
         Allows processing large result sets without loading it all into memory at once.
+        NOTE The connection is taken from the pool once iteration starts, and returned when the rows run out
+        or the generator is closed, so a generator that's never iterated never holds a connection.
 
         Args:
             command (LiteralString): The SQL query to execute.
             params (tuple[Any,...] | list[tuple[Any,...]], optional): Parameters to be used with the SQL query. Defaults to None.
-            connection (aiomysql.Connection, optional): The database connection to use. Defaults to None.
             is_query (bool, optional): Indicates if the command is a query (should always be True for this method). Defaults to True.
             args (dict, optional): Variables for safe string formatting of the SQL command. Defaults to None.
             unbuffered (bool, optional): Indicates if the query should be unbuffered (should always be True for this method). Defaults to True.
@@ -631,21 +711,25 @@ class MySqlDatabase:
             Any exceptions raised by _async_execute_sql_command or cursor operations.
         """
         logger.debug("Executing async unbuffered query...")
+        connection = None
+        cursor = None
         try:
+            connection: AioMySqlConnection = await self._async_get_connection_from_pool()
             cursor = await self._async_execute_sql_command(
                 command, params=params, connection=connection, is_query=is_query, 
                 args=args, unbuffered=unbuffered, return_dict=return_dict, size=size
             )
             async for row in cursor:
-                print(row)
                 yield row
         finally:
-            await cursor.close()
-            self._return_connection_to_pool(connection)
+            if cursor is not None:
+                await cursor.close()
+            if connection is not None:
+                self._return_connection_to_pool(connection)
 
 
     async def async_insert_by_batch(self,
-                                    input_list: list[dict] | list[tuple],
+                                    input_list: Iterable[dict] | Iterable[tuple] | pd.DataFrame,
                                     batch_size: int=INSERT_BATCH_SIZE,
                                     table: str=None,
                                     args: dict=None,
@@ -657,7 +741,8 @@ class MySqlDatabase:
         NOTE table and batch_size function as positional arguments, but are set as a keyword arguments for code clarity.
 
         Args:
-            input_list (list[dict] | list[tuple]): Data to be inserted.
+            input_list (Iterable[dict] | Iterable[tuple] | pd.DataFrame): Data to be inserted.
+                Can be any iterable of rows, including a generator. DataFrames are read row by row.
             batch_size (int): Number of records per batch. Defaults to constant INSERT_BATCH_SIZE.
             table (str): Name of the table to insert into.
             args (dict, optional): Argument key-values for formatting named placeholders in the INSERT statement.
@@ -668,31 +753,60 @@ class MySqlDatabase:
         Raises:
             Exception: If there's any error inserting the data.
         """
-        type_check = _type_check_async_insert_by_batch(input_list, 
+        # NOTE Rows are read from input_list a batch at a time, so they never all have to be in a list at once.
+        total = len(input_list) if isinstance(input_list, Sized) else None
+        if isinstance(input_list, pd.DataFrame):
+            columns = columns or input_list.columns.to_list()
+            input_list = input_list.itertuples(index=False, name=None)
+        rows = iter(input_list)
+        first_row = next(rows, None)
+
+        type_check = _type_check_async_insert_by_batch([] if first_row is None else [first_row], 
                                                         batch_size=batch_size, 
                                                         args=args, 
                                                         columns=columns, 
                                                         statement=statement, 
                                                         table=table, 
                                                         update=update)
-        if type_check[0]:
+        if type_check[3]:
             logger.error("async_insert_by_batch input_list is empty. Ending function...")
             return
         else:
             command, args, batch_size, _ = type_check
+        rows = itertools.chain((first_row,), rows)
+
+        # Route very large plain inserts through LOAD DATA LOCAL INFILE, as it's much faster than any INSERT.
+        # NOTE This skips upserts and custom statements, since LOAD DATA can't do ON DUPLICATE KEY UPDATE.
+        # It's also only done for sequences, since the INSERT fallback below has to be able to read the rows again.
+        if (isinstance(input_list, Sequence) and total >= LOAD_DATA_THRESHOLD 
+            and not update and not statement and args.get("table") and args.get("columns")):
+            try:
+                await self._async_load_data_local_infile(input_list, table=args["table"], columns=args["columns"])
+                logger.info(f"Insertion complete. Total records inserted: {total}")
+                return
+            except Exception as e:
+                logger.warning(f"LOAD DATA LOCAL INFILE failed: {e}\nFalling back to batched INSERT...")
 
         total_inserted = 0
-        for i in range(0, len(input_list), batch_size):
-            params = input_list[i:i+batch_size]
+        batches_since_last_log = 0
+        last_log_time = time.monotonic()
+        while params := list(itertools.islice(rows, batch_size)):
             try:
                 await self.async_execute_sql_command(command, params=params, args=args)
                 total_inserted += len(params)
-                logger.info(f"Inserted {len(params)} records into the database. Total: {total_inserted}")
+                batches_since_last_log += 1
+
+                # Only log progress periodically, as logging every batch serializes large loads on the logger's lock.
+                now = time.monotonic()
+                if batches_since_last_log >= INSERT_LOG_EVERY_N_BATCHES or now - last_log_time >= INSERT_LOG_INTERVAL_IN_SECONDS:
+                    logger.info(f"Inserted {total_inserted} of {total if total is not None else '?'} records into the database...")
+                    batches_since_last_log = 0
+                    last_log_time = now
             except Exception as e:
                 logger.error(f"Error inserting batch: {e}")
                 # Save batched input_list in CSV in case something goes wrong
                 try:
-                    csv_filename = f"failed_insert_batch_{i}_{make_id()}.csv"
+                    csv_filename = f"failed_insert_batch_{total_inserted}_{make_id()}.csv"
                     pd.DataFrame(params).to_csv(csv_filename, index=False)
                     logger.info(f"Saved failed batch to {csv_filename}")
                 except Exception as csv_error:
@@ -701,6 +815,180 @@ class MySqlDatabase:
         logger.info(f"Insertion complete. Total records inserted: {total_inserted}")
 
 
+    async def async_insert_multi_row(self,
+                                     command: LiteralString,
+                                     input_list: list[dict] | list[tuple],
+                                     args: dict=None,
+                                     batch_size: int=INSERT_BATCH_SIZE,
+                                     single_transaction: bool=False,
+                                     bulk_load_session: bool=False
+                                     ) -> None:
+        """
+        Asynchronously insert data into a MySQL database with multi-row INSERT statements.
+        Each batch is sent as a single 'INSERT ... VALUES (...), (...), ...' statement,
+        so one round-trip to the server covers the whole batch. Batches are executed concurrently,
+        each in its own transaction, unless single_transaction is True.
+
+        Args:
+            command (LiteralString): INSERT statement with a '{values}' placeholder where the VALUES rows should go.
+                Can also contain an ON DUPLICATE KEY UPDATE clause.
+            input_list (list[dict] | list[tuple]): Data to be inserted. Every row must have the same number of values.
+            args (dict, optional): Argument key-values for formatting named placeholders in the command.
+            batch_size (int): Number of rows per INSERT statement. Defaults to constant INSERT_BATCH_SIZE.
+            single_transaction (bool, optional): If True, run every batch one after another on one connection,
+                and commit them all at once. Either all of the rows are inserted or none are. Defaults to False.
+            bulk_load_session (bool, optional): If True and single_transaction is True, apply BULK_LOAD_SESSION_SETTINGS
+                to the connection for the insert. Defaults to False.
+
+        Raises:
+            Exception: If there's any error inserting the data.
+
+        Example:
+            >>> await db.async_insert_multi_row(
+            >>>     "INSERT INTO sources ({columns}) VALUES {values} ON DUPLICATE KEY UPDATE {update};",
+            >>>     output_list_of_dicts,
+            >>>     args={"columns": "gnis, place_name", "update": "place_name = VALUES(place_name)"}
+            >>> )
+        """
+        if not input_list:
+            logger.error("async_insert_multi_row input_list is empty. Ending function...")
+            return
+        if batch_size <= 0:
+            logger.warning(f"invalid batch_size value. Defaulting to {INSERT_BATCH_SIZE}")
+            batch_size = INSERT_BATCH_SIZE
+
+        # NOTE Rows that are already tuples (e.g. from DataFrame.to_records().tolist()) are used as-is, instead of being copied.
+        rows = input_list if isinstance(input_list[0], tuple) else [
+            tuple(row.values()) if isinstance(row, dict) else tuple(row) for row in input_list
+        ]
+        row_placeholders = f"({get_num_placeholders(rows[0])})"
+
+        async def _insert_batch(batch: list[tuple]) -> None:
+            async with self._async_pool_acquire() as connection:
+                _, _, batch_command = self._type_check_execute_sql_command(connection, command, args=args)
+                batch_command = safe_format(batch_command, values=", ".join([row_placeholders] * len(batch)))
+                params = tuple(value for row in batch for value in row)
+                async with connection.cursor() as cursor:
+                    try:
+                        await connection.begin()
+                        await cursor.execute(batch_command, params)
+                        await connection.commit()
+                    except Exception as e:
+                        logger.error(f"Error inserting batch of {len(batch)} rows: {e}")
+                        await connection.rollback()
+                        raise e
+
+        async def _insert_batches_in_one_transaction(batches: list[list[tuple]]) -> None:
+            async with self._async_pool_acquire() as connection:
+                _, _, command_with_args = self._type_check_execute_sql_command(connection, command, args=args)
+                async with self._async_bulk_load_session(connection, enabled=bulk_load_session), connection.cursor() as cursor:
+                    try:
+                        await connection.begin()
+                        for batch in batches:
+                            batch_command = safe_format(command_with_args, values=", ".join([row_placeholders] * len(batch)))
+                            await cursor.execute(batch_command, tuple(value for row in batch for value in row))
+                        await connection.commit()
+                    except Exception as e:
+                        logger.error(f"Error inserting {len(rows)} rows in one transaction: {e}")
+                        await connection.rollback()
+                        raise e
+
+        batches = _split_rows_into_batches(rows, batch_size)
+        logger.info(f"Inserting {len(rows)} records in {len(batches)} multi-row INSERT statements...")
+        if single_transaction:
+            await _insert_batches_in_one_transaction(batches)
+        else:
+            await asyncio.gather(*[_insert_batch(batch) for batch in batches])
+        logger.info(f"Insertion complete. Total records inserted: {len(rows)}")
+
+
+    async def _async_load_data_local_infile(self,
+                                            input_list: list[dict] | list[tuple],
+                                            table: str=None,
+                                            columns: str=None
+                                            ) -> None:
+        """
+        Bulk load data into a MySQL table by streaming it to a temporary CSV file,
+        then running LOAD DATA LOCAL INFILE on it.
+
+        Args:
+            input_list (list[dict] | list[tuple]): Data to be inserted.
+            table (str): Name of the table to insert into.
+            columns (str): Comma-separated column names, in the same order as the values in input_list.
+
+        Raises:
+            Exception: If there's any error writing the CSV file or loading it into the database.
+        """
+        csv_path = _write_load_data_csv(input_list)
+        try:
+            logger.info(f"Loading {len(input_list)} records into {table} via LOAD DATA LOCAL INFILE...")
+            await self.async_execute_sql_command(LOAD_DATA_STATEMENT, params=(csv_path,), args={"table": table, "columns": columns})
+        finally:
+            os.remove(csv_path)
+
+
+    async def async_upsert_via_load_data(self,
+                                         input_list: list[dict] | list[tuple],
+                                         table: str=None,
+                                         columns: str=None,
+                                         update: str=None,
+                                         bulk_load_session: bool=False
+                                         ) -> None:
+        """
+        Bulk upsert data into a MySQL table with LOAD DATA LOCAL INFILE.
+        The data is loaded into a temporary copy of the table, then merged into the table
+        with one INSERT ... SELECT ... ON DUPLICATE KEY UPDATE statement.
+        Everything runs on one connection, since temporary tables only exist on the connection that made them.
+
+        Args:
+            input_list (list[dict] | list[tuple]): Data to be upserted.
+            table (str): Name of the table to upsert into.
+            columns (str): Comma-separated column names, in the same order as the values in input_list.
+            update (str): The ON DUPLICATE KEY UPDATE assignments, e.g. 'place_name = VALUES(place_name)'.
+            bulk_load_session (bool, optional): If True, apply BULK_LOAD_SESSION_SETTINGS to the connection for the upsert.
+                Defaults to False.
+
+        Raises:
+            Exception: If there's any error writing the CSV file or loading it into the database.
+
+        Example:
+            >>> await db.async_upsert_via_load_data(
+            >>>     output_list_of_tuples,
+            >>>     table="sources",
+            >>>     columns="gnis, source_municode",
+            >>>     update="source_municode = VALUES(source_municode)"
+            >>> )
+        """
+        args = {"table": table, "temp_table": f"temp_{table}_upsert", "columns": columns, "update": update}
+        csv_path = _write_load_data_csv(input_list)
+        try:
+            logger.info(f"Upserting {len(input_list)} records into {table} via LOAD DATA LOCAL INFILE...")
+            async with self._async_pool_acquire() as connection:
+                _, _, load_command = self._type_check_execute_sql_command(
+                    connection, LOAD_DATA_STATEMENT, params=(csv_path,), args={"table": args["temp_table"], "columns": columns}
+                )
+                create_command, drop_command, upsert_command = (
+                    safe_format(statement, **args)
+                    for statement in (CREATE_TEMP_TABLE_STATEMENT, DROP_TEMP_TABLE_STATEMENT, UPSERT_FROM_TEMP_TABLE_STATEMENT)
+                )
+                async with self._async_bulk_load_session(connection, enabled=bulk_load_session), connection.cursor() as cursor:
+                    try:
+                        await connection.begin()
+                        await cursor.execute(drop_command)
+                        await cursor.execute(create_command)
+                        await cursor.execute(load_command, (csv_path,))
+                        await cursor.execute(upsert_command)
+                        await cursor.execute(drop_command)
+                        await connection.commit()
+                    except Exception as e:
+                        logger.error(f"Error upserting {len(input_list)} records into {table}: {e}")
+                        await connection.rollback()
+                        raise e
+            logger.info(f"Upsert complete. Total records upserted: {len(input_list)}")
+        finally:
+            os.remove(csv_path)
+
+
     async def async_execute_sql_command(self,
                                   command: LiteralString,
                                   params: ( tuple[Any,...] | dict[str,Any] | list[tuple[Any,...]] | list[dict[str,Any]] ) = None,
@@ -737,28 +1025,23 @@ class MySqlDatabase:
             For database alteration commands (non-queries), returns None.
         """
 
-        connection: AioMySqlConnection = await self._async_get_connection_from_pool()
-
-        pattern = re.compile(r"^(SELECT|SHOW|WITH|EXPLAIN)\b", re.IGNORECASE) # If the command starts with SELECT, SHOW, WITH, or EXPLAIN, it's a query.
         is_query = bool(QUERY_PATTERN.match(command.strip()))
 
         # Execute the SQL command.
-        if is_query: # Query route
-            if unbuffered: # Unbuffered query
-                logger.debug(f"Chose unbuffered query route.")
-                return await self._async_execute_unbuffered_query(command, params=params, connection=connection, is_query=is_query, 
-                                                                args=args, return_dict=return_dict, unbuffered=unbuffered, size=size)
-            else: # Buffered query
+        if is_query and unbuffered: # Unbuffered query
+            # NOTE The generator takes its own connection from the pool when it's first iterated, and returns it itself.
+            logger.debug(f"Chose unbuffered query route.")
+            return self._async_execute_unbuffered_query(command, params=params, is_query=is_query, 
+                                                            args=args, return_dict=return_dict, unbuffered=unbuffered, size=size)
+
+        async with self._async_pool_acquire() as connection:
+            if is_query: # Buffered query
                 logger.debug(f"Chose buffered query route.")
-                results = await self._async_execute_sql_command(command, params=params, connection=connection, is_query=is_query, 
-                                                                args=args, return_dict=return_dict, size=size)
-                self._return_connection_to_pool(connection)
-                return results
-
-        else: # Alteration route
-            await self._async_execute_sql_command(command, params=params, connection=connection, args=args)
-            self._return_connection_to_pool(connection)
-            return
+                return await self._async_execute_sql_command(command, params=params, connection=connection, is_query=is_query, 
+                                                            args=args, return_dict=return_dict, size=size)
+            else: # Alteration route
+                await self._async_execute_sql_command(command, params=params, connection=connection, args=args)
+                return
 
 
     def execute_sql_command(self,
@@ -777,7 +1060,8 @@ class MySqlDatabase:
                                     query: str,
                                     params: tuple = None,
                                     args: dict = None,
-                                    unbuffered=False
+                                    unbuffered=False,
+                                    dtype_backend: str = None
                                     ) -> pd.DataFrame:
         """
         Execute an async MySQL query and return results as a Pandas DataFrame.
@@ -787,6 +1071,8 @@ class MySqlDatabase:
             params: Query parameters.
             args: Variables for safe string formatting.
             unbuffered: If True, uses unbuffered query.
+            dtype_backend: If given (e.g. 'pyarrow' or 'numpy_nullable'), convert the columns to that backend's dtypes.
+                Arrow-backed string columns take up far less memory than object columns, and their .str methods are vectorized.
         Returns:
             A Pandas DataFrame containing the query results.
 
@@ -794,7 +1080,50 @@ class MySqlDatabase:
             MySQLError: If there's an error executing the query.
         """
         results = await self.async_execute_sql_command(query, params=params, unbuffered=unbuffered, args=args, return_dict=True)
-        return pd.DataFrame.from_dict(results)
+        if unbuffered: # NOTE Unbuffered queries return an async generator, so its rows have to be read out first.
+            results = [row async for row in results]
+        df = pd.DataFrame.from_records(results)
+        return df.convert_dtypes(dtype_backend=dtype_backend) if dtype_backend else df
+
+
+    async def async_query_to_dataframe_chunks(self,
+                                              query: str,
+                                              params: tuple = None,
+                                              args: dict = None,
+                                              chunk_size: int = QUERY_CHUNK_SIZE,
+                                              dtype_backend: str = None
+                                              ) -> AsyncGenerator[pd.DataFrame, None]:
+        """
+        Stream an async MySQL query through a server-side cursor, and yield its results as Pandas DataFrames.
+        NOTE Only one chunk of rows is held in Python at a time, so callers can start on the first rows
+        before the whole result set has been read.
+
+        Args:
+            query: SQL query to execute.
+            params: Query parameters.
+            args: Variables for safe string formatting.
+            chunk_size: Number of rows in each DataFrame. Defaults to constant QUERY_CHUNK_SIZE.
+            dtype_backend: If given (e.g. 'pyarrow' or 'numpy_nullable'), convert each chunk's columns to that backend's dtypes.
+
+        Yields:
+            pd.DataFrame: The next chunk_size rows of the query results.
+
+        Raises:
+            MySQLError: If there's an error executing the query.
+
+        Example:
+            >>> async for chunk in db.async_query_to_dataframe_chunks("SELECT gnis, place_name FROM locations;"):
+            >>>     process(chunk)
+        """
+        async with self._async_pool_acquire() as connection:
+            _, params, command = self._type_check_execute_sql_command(connection, query, params=params, args=args)
+            async with connection.cursor(aiomysql.SSCursor) as cursor:
+                logger.info(f"Streaming query '{command}' in chunks of {chunk_size} rows...")
+                await cursor.execute(command, params) if params else await cursor.execute(command)
+                columns = [column[0] for column in cursor.description]
+                while rows := await cursor.fetchmany(chunk_size):
+                    df = pd.DataFrame.from_records(rows, columns=columns)
+                    yield df.convert_dtypes(dtype_backend=dtype_backend) if dtype_backend else df
 
 
     def query_to_dataframe(self,
@@ -848,6 +1177,68 @@ class MySqlDatabase:
         return 
 
 
+class _LoadDataNull:
+    """
+    Sentinel that csv.writer treats as a number, so it's written as a bare NULL.
+    """
+    def __float__(self) -> float:
+        return 0.0
+
+    def __str__(self) -> str:
+        return "NULL"
+
+_LOAD_DATA_NULL = _LoadDataNull()
+
+
+def _to_load_data_value(value: Any) -> Any:
+    """
+    Convert a Python value into something LOAD DATA INFILE will read back correctly.
+    """
+    # NOTE NaN, pd.NA, and NaT are all missing values in pandas, and would otherwise be written as strings like 'nan'.
+    if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value):
+        return _LOAD_DATA_NULL
+    elif isinstance(value, bool):
+        return int(value)
+    else:
+        return value
+
+
+def _write_load_data_csv(input_list: list[dict] | list[tuple]) -> str:
+    """
+    Write rows to a temporary CSV file that LOAD DATA INFILE can read, and return its path.
+    NOTE The caller is responsible for deleting the file.
+    """
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", newline="", encoding="utf-8", delete=False) as file:
+        # Quote all non-numeric values, so that only bare NULLs are read as NULL by MySQL.
+        writer = csv.writer(file, quoting=csv.QUOTE_NONNUMERIC, escapechar="\\", doublequote=False, lineterminator="\n")
+        for row in input_list:
+            values = row.values() if isinstance(row, dict) else row
+            writer.writerow([_to_load_data_value(value) for value in values])
+    return file.name
+
+
+def _split_rows_into_batches(rows: list[tuple], batch_size: int, max_bytes: int=MAX_INSERT_STATEMENT_BYTES) -> list[list[tuple]]:
+    """
+    Split rows into batches of at most batch_size rows, starting a new batch early
+    if the batch's values would take up more than max_bytes in the INSERT statement.
+    NOTE The size is an estimate based on each value's string length, plus a few bytes for quotes and commas.
+    """
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for row in rows:
+        row_bytes = sum(len(str(value)) + 4 for value in row)
+        if batch and (len(batch) >= batch_size or batch_bytes + row_bytes > max_bytes):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(row)
+        batch_bytes += row_bytes
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 def _type_check_async_insert_by_batch(results: list[dict] | list[tuple],
                                     args: dict=None,
                                     batch_size: int=None,
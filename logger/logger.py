@@ -37,7 +37,7 @@ import uuid
 
 import yaml
 
-from utils.logger.delete_empty_log_files import delete_empty_log_files, delete_zone_identifier_files
+from utils.logger.delete_empty_log_files import cleanup
 
 def make_id():
     return str(uuid.uuid4())
@@ -51,8 +51,7 @@ debug_log_folder = os.path.join(base_path, "debug_logs")
 script_dir = os.path.dirname(os.path.realpath(__file__))
 config_path = os.path.join(script_dir, './config.yaml')
 try:
-    delete_empty_log_files(debug_log_folder)
-    delete_zone_identifier_files(base_path)
+    cleanup(base_path) # NOTE debug_log_folder is inside base_path, so this cleans both in one pass.
     with open(config_path, "r") as f:
         config = yaml.safe_load(f)
     DEFAULT_LOG_LEVEL = config['SYSTEM']['DEFAULT_LOG_LEVEL']
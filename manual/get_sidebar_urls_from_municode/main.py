@@ -11,8 +11,9 @@ import pandas as pd
 # Otherwise, we get a ModuleNotFoundError
 from pathlib import Path
 import sys
-parent_dir = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+parent_dir = str(Path(__file__).resolve().parent.parent.parent)
+if parent_dir not in sys.path: # NOTE Only needed when this file is run as a script.
+    sys.path.insert(0, parent_dir)
 
 from database.database import MySqlDatabase
 from config.config import CUSTOM_MODULES_FOLDER, OUTPUT_FOLDER, LEGAL_WEBSITE_DICT
@@ -28,62 +28,77 @@ Dependencies:
 Note: This module relies on a custom Logger class and a config module
 for output folder specification.
 """
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import functools
 import os
 import re
 import time
 from typing import Any, NamedTuple
 
 
+import numpy as np
 import pandas as pd
 
 
 from pathlib import Path
 import sys
-parent_dir = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(parent_dir))
-print(parent_dir)
+parent_dir = str(Path(__file__).resolve().parent.parent.parent)
+if parent_dir not in sys.path: # NOTE Only needed when this file is run as a script.
+    sys.path.insert(0, parent_dir)
 
 from config.config import OUTPUT_FOLDER
 from logger.logger import Logger
 logger = Logger(logger_name=__name__, stacklevel=2)
 
 
+# Words in place names, texts, and hrefs. Used to build each state's word index.
+WORD_REGEX = re.compile(r'\w+')
+# Joins each source's text and href into one string to match against.
+TEXT_HREF_SEPARATOR = '\x01'
+# Number of rows pandas formats and writes at a time when saving results to CSV.
+CSV_CHUNK_SIZE = 50_000
+
+
 class Matcher:
+    # (compiled pattern, replacement) pairs applied in order to clean a place name.
+    # NOTE These are compiled once when the class is loaded, not per Matcher or per name.
+    CLEAN_PLACE_NAME_SUBS: tuple[tuple[re.Pattern, str], ...] = (
+        (re.compile(r"^.*?of\s+", flags=re.IGNORECASE), ''), # 'of' in the name, e.g. "City of ..."
+        (re.compile(r'\([^()]*\)', flags=re.IGNORECASE), ''), # Parentheses
+        (re.compile(r'^"([^"]*)".*$', flags=re.IGNORECASE), r'\1'), # Quotations followed by a comma.
+        (re.compile(r'(Township|Charter Township|Chrtr Township|Metro Township).*$', flags=re.IGNORECASE), r'\1'), # Townships
+    )
+
     def __init__(self, sources_df: pd.DataFrame, locations_df: pd.DataFrame):
-        self._sources_df = sources_df
-        self._locations_df = self._make_county_boolean(locations_df)
-        self.regex = self._compile_regex()
+        self._sources_df = self._to_categories(self._to_arrow_strings(sources_df, ('text', 'href')), ('state_code', 'source'))
+        self._locations_df = self._make_county_boolean(self._to_arrow_strings(locations_df, ('place_name',)))
         self.not_places = self._define_not_places()
+        self.not_places_pattern = '|'.join(re.escape(not_place) for not_place in self.not_places)
         self.county_eqs = self._define_county_equivalents()
+        self.county_eqs_pattern = '|'.join(re.escape(county) for county in self.county_eqs)
         self.df = self._prepare_dataframes()
 
+    @staticmethod
+    def _to_arrow_strings(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+        """
+        Back the given string columns with Arrow, so that the .str methods used during matching run as Arrow kernels.
+        """
+        return df.astype({col: 'string[pyarrow]' for col in columns if col in df.columns})
+
+    @staticmethod
+    def _to_categories(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+        """
+        Dictionary-encode the given low-cardinality columns (e.g. state codes and source names).
+        """
+        return df.astype({col: 'category' for col in columns if col in df.columns})
+
     @staticmethod
     def _make_county_boolean(locations_df: pd.DataFrame) -> pd.DataFrame:
         locations_df = locations_df.rename(columns={'class_code': 'county'})
-        locations_df['county'] = locations_df['county'].str.contains('H')
+        locations_df['county'] = locations_df['county'].str.contains('H', na=False)
         return locations_df
 
-    @staticmethod
-    def _compile_regex() -> dict[str, dict[str, Any]]:
-        return {
-            'clean_of_from_name_regex': {
-                'regex': re.compile(r"^.*?of\s+", flags=re.IGNORECASE),
-                'operation': lambda name: re.sub(r"^.*?of\s+", '', name, flags=re.IGNORECASE)
-            },
-            'clean_parentheses_regex': {
-                'regex': re.compile(r'\([^()]*\)', flags=re.IGNORECASE),
-                'operation': lambda name: re.sub(r'\([^()]*\)', '', name, flags=re.IGNORECASE)
-            },
-            'clean_quotation_comma_regex': {
-                'regex': re.compile(r'^"([^"]*)".*$', flags=re.IGNORECASE),
-                'operation': lambda name: re.sub(r'^"([^"]*)".*$', r'\1', name, flags=re.IGNORECASE)
-            },
-            'clean_township_regex': {
-                'regex': re.compile(r'(Township|Charter Township|Chrtr Township|Metro Township).*$', flags=re.IGNORECASE),
-                'operation': lambda name: re.sub(r'(Township|Charter Township|Chrtr Township|Metro Township).*$', r'\1', name, flags=re.IGNORECASE)
-            }
-        }
-
     @staticmethod
     def _define_not_places() -> list[str]:
         return [
@@ -96,21 +111,27 @@ class Matcher:
 
     @staticmethod
     def _define_county_equivalents() -> list[str]:
+        # NOTE These are only checked as substrings, so variants like "_county_", "city_county",
+        # and "city and borough" are already covered by their root terms.
         return [
-            "county", "county_", "_county", "_county_",
-            "borough", "borough_", "_borough", "_borough_",
-            "parish", "parish_", "_parish", "_parish_",
-            "census area", "census_area", "_census_area", "_census_area_",
-            "municipality", "municipality_", "_municipality", "_municipality_",
-            "city and borough", "city_and_borough", "_city_and_borough", "_city_and_borough_",
-            "consolidated government", "consolidated_government", "_consolidated_government", "_consolidated_government_",
-            "metropolitan government", "metropolitan_government", "_metropolitan_government", "_metropolitan_government_",
-            "unified government", "unified_government", "_unified_government", "_unified_government_",
-            "city-county", "city_county", "_city_county", "_city_county_",
+            "county", "borough", "parish",
+            "census area", "census_area",
+            "municipality",
+            "consolidated government", "consolidated_government",
+            "metropolitan government", "metropolitan_government",
+            "unified government", "unified_government",
         ]
 
     def _prepare_dataframes(self) -> dict[str, pd.DataFrame]:
-        is_place = ~self._sources_df['text'].apply(self._remove_non_places)
+        # NOTE A cleaned name only depends on the place name, so clean each one once here instead of during matching.
+        self._locations_df['cleaned_name'] = self._locations_df['place_name'].str.lower().map(self._clean_place_name)
+        # NOTE Lower-case each text and href once here. The filters below and the matching itself all read these columns.
+        self._sources_df = self._sources_df.assign(
+            text_lc=self._sources_df['text'].fillna('').str.lower(),
+            href_lc=self._sources_df['href'].fillna('').str.lower()
+        )
+        # NOTE A plain pattern string is used instead of a compiled one, as Arrow-backed string columns don't accept compiled patterns.
+        is_place = ~self._sources_df['text_lc'].str.contains(self.not_places_pattern, regex=True, na=False)
         df = {
             "locations": self._locations_df,
             "counties": self._locations_df[self._locations_df["county"]],
@@ -119,38 +140,93 @@ class Matcher:
             "places": self._sources_df[is_place],
             "non_places": self._sources_df[~is_place],
         }
-        mask = df['places'].apply(self._check_if_county, axis=1)
+        mask = (
+            df['places']['href_lc'].str.contains(self.county_eqs_pattern, regex=True, na=False)
+            | df['places']['text_lc'].str.contains(self.county_eqs_pattern, regex=True, na=False)
+        )
         df['s_counties'] = df['places'][mask]
         df['s_cities'] = df['places'][~mask]
         return df
 
-    def _remove_non_places(self, text: str) -> bool:
-        return any(non_place in text.lower() for non_place in self.not_places)
+    @classmethod
+    def _clean_place_name(cls, place_name: str) -> str:
+        for pattern, repl in cls.CLEAN_PLACE_NAME_SUBS:
+            place_name = pattern.sub(repl, place_name)
+        return place_name
 
-    def _check_if_county(self, row: NamedTuple) -> bool:
-        lower_href = row.href.lower()
-        lower_text = row.text.lower()
-        return any(county in lower_href or county in lower_text for county in self.county_eqs)
+    @staticmethod
+    def _make_word_index(state_places: pd.DataFrame) -> dict[str, set[int]]:
+        """
+        Scan each of a state's combined texts and hrefs once, and map every word in them
+        to the positions of the rows it appears in.
+        """
+        word_index = defaultdict(set)
+        for position, text_and_href in enumerate(state_places['text_href_lc'].tolist()):
+            for word in WORD_REGEX.findall(text_and_href):
+                word_index[word].add(position)
+        return word_index
 
-    def _is_place_in_text(self, row: NamedTuple, text: str) -> bool:
-        text = text.lower()
-        place_name = row.place_name.lower()
+    @staticmethod
+    def _get_candidates(place_name: str, state_places: pd.DataFrame, word_index: dict[str, set[int]]) -> pd.DataFrame:
+        """
+        Get the rows that contain every word in the place name.
+        NOTE A whole-word match of the place name can only happen in these rows,
+        so only they need to be checked with the regex.
+        """
+        words = WORD_REGEX.findall(place_name)
+        if not words:
+            return state_places
+        postings = sorted((word_index.get(word, set()) for word in words), key=len)
+        positions = postings[0].intersection(*postings[1:])
+        return state_places.iloc[sorted(positions)]
 
-        for operation in self.regex.values():
-            place_name = operation['operation'](place_name)
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compile_boundary_pattern(place_name: str) -> re.Pattern:
+        return re.compile(r'\b' + re.escape(place_name) + r'\b')
 
-        pattern = r'\b' + re.escape(place_name) + r'\b'
-        match = bool(re.search(pattern, text))
-        if match:
-            logger.debug(f"'{place_name}' in '{text}' with county={row.county} using pattern '{pattern}'", t=2, off=True)
-        return match
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == '_'
 
-    def _match_urls_to_locations(self, row: NamedTuple, state_places: pd.DataFrame) -> dict[str, Any]:
+    @staticmethod
+    def _is_place_in_text(place_name: str, text: str) -> bool:
+        """
+        Check if the place name is in the text as a whole word, i.e. like re.search(r'\bplace_name\b', text).
+        NOTE When the name starts and ends with a word character (nearly always), this uses str.find and
+        checks the characters on either side of each hit, which skips the regex engine.
+        Other names fall back to a compiled regex that is cached per name.
+        """
+        if not (place_name and Matcher._is_word_char(place_name[0]) and Matcher._is_word_char(place_name[-1])):
+            return Matcher._compile_boundary_pattern(place_name).search(text) is not None
+
+        end_offset = len(place_name)
+        position = text.find(place_name)
+        while position >= 0:
+            end = position + end_offset
+            if (
+                (position == 0 or not Matcher._is_word_char(text[position - 1]))
+                and (end == len(text) or not Matcher._is_word_char(text[end]))
+            ):
+                return True
+            position = text.find(place_name, position + 1)
+        return False
+
+    @staticmethod
+    def _match_urls_to_locations(row: NamedTuple, state_places: pd.DataFrame, word_index: dict[str, set[int]]) -> dict[str, Any]:
         # logger.debug(f"row: {row}")
         try:
-            text_mask = state_places.apply(lambda x: self._is_place_in_text(row, x['text']), axis=1)
-            href_mask = state_places.apply(lambda x: self._is_place_in_text(row, x['href']), axis=1)
-            matches_df = state_places[text_mask | href_mask]
+            place_name = row.cleaned_name
+            pattern = r'\b' + re.escape(place_name) + r'\b'
+
+            # NOTE The candidates already have a lower-cased 'text_href_lc' column, so this is one check per candidate.
+            candidates = Matcher._get_candidates(place_name, state_places, word_index)
+            mask = np.array(
+                [Matcher._is_place_in_text(place_name, text) for text in candidates['text_href_lc'].tolist()], dtype=bool
+            )
+            # NOTE Pull the matched values straight out as arrays instead of slicing a new DataFrame.
+            hrefs = candidates['href'].to_numpy()[mask]
+            sources = candidates['source'].to_numpy()[mask]
 
             output_dict = {
                 'gnis': row.gnis,
@@ -160,13 +236,14 @@ class Matcher:
                 'source': None
             }
 
-            if not matches_df.empty:
-                if len(matches_df) == 1:
-                    output_dict['href'] = matches_df.iloc[0]['href']
-                    output_dict['source'] = matches_df.iloc[0]['source']
+            if len(hrefs):
+                logger.debug(f"'{place_name}' matched {len(hrefs)} hrefs with county={row.county} using pattern '{pattern}'", t=2, off=True)
+                if len(hrefs) == 1:
+                    output_dict['href'] = hrefs[0]
+                    output_dict['source'] = sources[0]
                 else:
-                    output_dict['href'] = matches_df['href'].tolist()
-                    output_dict['source'] = matches_df['source'].tolist()
+                    output_dict['href'] = hrefs.tolist()
+                    output_dict['source'] = sources.tolist()
 
             return output_dict
         except Exception as e:
@@ -177,45 +254,59 @@ class Matcher:
         start = time.time()
         output_list = []
 
-        for gov_type, gov_unit in [("cities", self.df['cities']), ("counties", self.df['counties'])]:
-            for state, state_df in gov_unit.groupby("state_code"):
-                logger.info(f"Processing {gov_type} in {state}")
-
-                input_df = self.df['s_counties'] if gov_type == "counties" else self.df['s_cities']
-                state_places = input_df[input_df['state_code'] == state]
+        # NOTE Bucket the sources by state once, instead of filtering the whole frame for every state.
+        places_by_state = {
+            gov_type: {state: group for state, group in self.df[f's_{gov_type}'].groupby("state_code", sort=False, observed=True)}
+            for gov_type in ("cities", "counties")
+        }
 
-                _output_list = [self._match_urls_to_locations(row, state_places) for row in state_df.itertuples()]
-                failed_to_match = sum(1 for result in _output_list if result['href'] is None)
+        # NOTE Each state is matched independently, so the states are spread across processes.
+        # Only the state's own locations and sources are sent to each worker.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = []
+            for gov_type, gov_unit in [("cities", self.df['cities']), ("counties", self.df['counties'])]:
+                for state, state_df in gov_unit.groupby("state_code"):
+                    state_places = places_by_state[gov_type].get(state, self.df[f's_{gov_type}'].iloc[0:0])
+                    futures.append(executor.submit(_match_one_state, gov_type, state, state_df, state_places))
 
-                logger.info(f"Failed to match {failed_to_match} out of {len(state_df)} {gov_type} in {state}")
-                output_list.extend(_output_list)
+            # Collect the results in submission order so the output is the same from run to run.
+            for future in futures:
+                output_list.extend(future.result())
 
         logger.info(f"Matching took {time.time() - start:.2f} seconds and matched {len(output_list)} places to an href")
 
         output_df = pd.DataFrame.from_dict(output_list)
-        self._save_results(output_df)
+        kinds = output_df['source'].map(self._classify_source)
+        self._save_results(output_df, kinds)
 
-        return output_df[output_df['source'].apply(self._filter_valid_sources)]
+        return output_df[kinds.isin(('single_match', 'multiple_sources'))]
 
-    def _filter_valid_sources(self, x: Any) -> bool:
+    @staticmethod
+    def _classify_source(x: Any) -> str:
+        """
+        Classify a matched source as 'single_match', 'multiple_sources' (several different sources),
+        'multiple_matches' (several matches in the same source), or 'unmatched'.
+        """
         if isinstance(x, str):
-            return True
+            return 'single_match'
         if isinstance(x, list) and len(x) > 1:
-            return len(set(x)) == len(x)
-        return False
+            return 'multiple_sources' if len(set(x)) == len(x) else 'multiple_matches'
+        return 'unmatched'
 
-    def _save_results(self, output_df: pd.DataFrame) -> None:
+    def _save_results(self, output_df: pd.DataFrame, kinds: pd.Series) -> None:
         result_dfs = {
             'output_df': output_df,
-            'non_places': self.df['non_places'],
-            'single_match': output_df[output_df['source'].apply(lambda x: isinstance(x, str))],
+            'non_places': self.df['non_places'].drop(columns=['text_lc', 'href_lc']),
+            'single_match': output_df[kinds == 'single_match'],
             'unmatched': output_df[output_df['source'].isna()],
-            'multiple_sources': output_df[output_df['source'].apply(lambda x: isinstance(x, list) and len(x) > 1 and len(set(x)) == len(x))],
-            'multiple_matches': output_df[output_df['source'].apply(lambda x: isinstance(x, list) and len(x) > 1 and len(set(x)) < len(x))]
+            'multiple_sources': output_df[kinds == 'multiple_sources'],
+            'multiple_matches': output_df[kinds == 'multiple_matches']
         }
 
-        for name, df in result_dfs.items():
-            self._save_to_csv(df, f"{name}.csv")
+        # NOTE The files are independent, so write them concurrently.
+        with ThreadPoolExecutor(max_workers=len(result_dfs)) as executor:
+            for name, df in result_dfs.items():
+                executor.submit(self._save_to_csv, df, f"{name}.csv")
 
     @staticmethod
     def _save_to_csv(df: pd.DataFrame, name: str) -> None:
@@ -224,10 +315,44 @@ class Matcher:
                 raise ValueError("The specified name does not have a '.csv' extension")
 
             logger.info(f"{len(df)} places were in {name.split('.')[0]}")
+            if df.empty:
+                logger.info(f"Skipped saving {name}, as it has no rows.")
+                return
 
             csv_path = os.path.join(OUTPUT_FOLDER, name)
-            df.to_csv(csv_path, index=False)
+            df.to_csv(csv_path, index=False, chunksize=CSV_CHUNK_SIZE)
             logger.info(f"Saved {name} to '{csv_path}'")
 
         except Exception as e:
             logger.debug(f"Could not save {name} to CSV: {e}")
+
+
+def _match_one_state(gov_type: str, state: str, state_df: pd.DataFrame, state_places: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Match one state's cities or counties to that state's sources.
+    NOTE This is a module-level function so that it can be pickled and run in a ProcessPoolExecutor.
+
+    Args:
+        gov_type (str): Either "cities" or "counties".
+        state (str): The state's two-letter code.
+        state_df (pd.DataFrame): The state's locations of the given gov_type.
+        state_places (pd.DataFrame): The state's sources of the given gov_type.
+
+    Returns:
+        list[dict[str, Any]]: One output dictionary per location in state_df.
+    """
+    logger.info(f"Processing {gov_type} in {state}")
+
+    # NOTE The text and href are joined with TEXT_HREF_SEPARATOR, which isn't a word character,
+    # so a place name can't match across the two.
+    state_places = state_places.assign(
+        text_href_lc=state_places['text_lc'] + TEXT_HREF_SEPARATOR + state_places['href_lc']
+    )
+
+    word_index = Matcher._make_word_index(state_places)
+
+    output_list = [Matcher._match_urls_to_locations(row, state_places, word_index) for row in state_df.itertuples()]
+    failed_to_match = sum(1 for result in output_list if result['href'] is None)
+
+    logger.info(f"Failed to match {failed_to_match} out of {len(state_df)} {gov_type} in {state}")
+    return output_list
@@ -4,16 +4,17 @@ Link place URLs from legal websites to ID information from table 'locations'
 import asyncio
 import os
 import re
-import time
 
 
+import numpy as np
 import pandas as pd
 from selenium import webdriver
 
 from pathlib import Path
 import sys
-parent_dir = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+parent_dir = str(Path(__file__).resolve().parent.parent.parent)
+if parent_dir not in sys.path: # NOTE Only needed when this file is run as a script.
+    sys.path.insert(0, parent_dir)
 
 from Matcher import Matcher
 from database.database import MySqlDatabase
@@ -24,7 +25,6 @@ logger = Logger(logger_name=__name__)
 
 
 from utils.shared.next_step import next_step
-from utils.shared.return_s_percent import return_s_percent
 
 
 from utils.manual.link_urls_to_location_data.main.make_urls import make_urls
@@ -39,11 +39,6 @@ from utils.manual.link_urls_to_location_data.main.pivot_df_from_long_to_wide imp
 
 
 
-am_legal_file = os.path.join(os.getcwd(), "american_legal_results.csv")
-municode_file = os.path.join(os.getcwd(), "municode_results.csv")
-general_code_file = os.path.join(os.getcwd(), "general_code_results.csv")
-
-
 LEGAL_WEBSITE_DICT = {
     "american_legal": {
         "base_url": "https://codelibrary.amlegal.com/regions/",
@@ -70,6 +65,34 @@ LEGAL_WEBSITE_DICT = {
 }
 
 
+# Columns and ON DUPLICATE KEY UPDATE clause for inserting into table 'sources'.
+_UPDATE_COLUMN_NAMES = ["source_municode", "source_general_code", "source_american_legal", "source_code_publishing_co"]
+_INSERT_COLUMN_NAMES = ["gnis", "place_name", "state_code"] + _UPDATE_COLUMN_NAMES
+SOURCES_INSERT_COLUMNS = ", ".join(_INSERT_COLUMN_NAMES)
+SOURCES_UPDATE_CLAUSE = ", ".join(f"{column} = VALUES({column})" for column in _UPDATE_COLUMN_NAMES)
+
+
+# Regex patterns for pulling the two-letter state code out of each source's landing page URL.
+# NOTE These are matched against the lower-cased URL.
+_STATE_PATTERNS: dict[str, re.Pattern] = {
+    "municode": re.compile(r'/([a-z]{2})(?:/|$)'), # Ex: https://library.municode.com/in
+    "american_legal": re.compile(r'/([a-z]{2})(?:/|$)'), # Ex: https://codelibrary.amlegal.com/regions/al
+    "general_code": re.compile(r'state=([a-z]{2})(?:&|$)'), # Ex: https://www.generalcode.com/source-library/?state=MO
+    "code_publishing_co": re.compile(r'state=([a-z]{2})(?:&|$)'),
+}
+
+
+def _match_state_code(url: str, source: str) -> str | None:
+    """
+    Get the upper-case state code from a landing page URL, or None if the source is unknown or there's no match.
+    """
+    pattern = _STATE_PATTERNS.get(source)
+    if pattern is None or not isinstance(url, str):
+        return None
+    match = pattern.search(url.lower())
+    return match.group(1).upper() if match else None
+
+
 def get_state_code_from_url(source_dict: dict[str, str]) -> dict[str, str|None]:
     """
     Extract the state code from the 'url' key in source_dict, and append it under key 'state_code'
@@ -95,16 +118,13 @@ def get_state_code_from_url(source_dict: dict[str, str]) -> dict[str, str|None]:
     source = source_dict['source']
     href = source_dict['href']
     url = source_dict['url']
-    match source:
-        case "municode":
-            pattern = r'/([a-z]{2})(?:/|$)' # Ex: https://library.municode.com/in
-        case "american_legal":
-            pattern = r'/([a-z]{2})(?:/|$)' # Ex: https://codelibrary.amlegal.com/regions/al
-        case source if source in "general_code" or "code_publishing_co":
-            pattern = r'state=([A-Za-z]{2})(?:&|$)' # Ex: https://www.generalcode.com/source-library/?state=MO
-        case _:
-            logger.warning(f"Href '{href}' has an unknown source '{source}'")
-    match = re.search(pattern, url.lower())
+    pattern = _STATE_PATTERNS.get(source)
+    if pattern is None: # Short-circuit unknown sources instead of guessing a pattern for them.
+        logger.warning(f"Href '{href}' has an unknown source '{source}'")
+        source_dict['state_code'] = None
+        return source_dict
+
+    match = pattern.search(url.lower())
 
     if match:
         state_code = match.group(1).upper()
@@ -118,72 +138,154 @@ def get_state_code_from_url(source_dict: dict[str, str]) -> dict[str, str|None]:
 
 
 
+# Keywords that identify a source, in order of precedence, as (column, keyword, source).
+# Anything that doesn't match one of these is from General Code.
+_SOURCE_KEYWORDS: tuple[tuple[str, str, str], ...] = (
+    ("url", "amlegal", "american_legal"),
+    ("url", "municode", "municode"),
+    ("href", "codepublishing", "code_publishing_co"),
+)
+_DEFAULT_SOURCE = "general_code"
+
+
 def get_source_from_url_and_href(source_dict: dict[str, str]
                          ) -> dict[str, str]:
-    if "amlegal" in source_dict['url']:
-        source_dict["source"] = "american_legal"
-    elif "municode" in source_dict['url']:
-        source_dict["source"] = "municode"
-    else:
-        if "codepublishing" in source_dict['href']:
-            source_dict["source"] = "code_publishing_co"
-        else:
-            source_dict["source"] = "general_code"
+    source_dict["source"] = next(
+        (source for column, keyword, source in _SOURCE_KEYWORDS if keyword in source_dict[column]), _DEFAULT_SOURCE
+    )
     return source_dict
 
 
 
-async def main():
+def add_source_and_state_code(sources_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized version of get_source_from_url_and_href and get_state_code_from_url.
+    Attach 'source' and 'state_code' columns to a dataframe of scraped URLs.
 
-    logger.info("Step 1. Make American Legal URLs.",f=True)
-    source = "american_legal"
-    am_legal_urls = make_urls(source)
-    logger.info("Made American legal URLs.")
+    Args:
+        sources_df (pd.DataFrame): A dataframe with 'url', 'href', and 'text' columns.
+
+    Returns:
+        The input dataframe with 'source' and 'state_code' columns added.
+    """
+    sources_df['source'] = np.select(
+        [sources_df[column].str.contains(keyword, regex=False, na=False) for column, keyword, _ in _SOURCE_KEYWORDS],
+        [source for _, _, source in _SOURCE_KEYWORDS],
+        default=_DEFAULT_SOURCE
+    )
+
+    # NOTE Every href scraped from a state's landing page shares that page's URL,
+    # so we only need to match the handful of unique (url, source) pairs, then join them back.
+    url_and_source = sources_df[['url', 'source']].drop_duplicates()
+    url_and_source['state_code'] = [
+        _match_state_code(url, source) for url, source in url_and_source.itertuples(index=False, name=None)
+    ]
+    sources_df = sources_df.merge(url_and_source, on=['url', 'source'], how='left')
+
+    missing = sources_df['state_code'].isna()
+    if missing.any():
+        logger.warning(f"No state code found for {missing.sum()} URLs.")
+        logger.debug(f"hrefs without a state code: {sources_df.loc[missing, 'href'].tolist()}")
+    return sources_df
+
+
+def fix_relative_hrefs(sources_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Concatenate the 'url' with the 'href' column if the href is a relative link (e.g. starts with '/').
+    """
+    href = sources_df['href']
+    sources_df['href'] = np.where(href.str.startswith('/', na=False), sources_df['url'] + href, href)
+    return sources_df
+
+
+def _make_chrome_options() -> webdriver.ChromeOptions:
+    """
+    Chrome options for scraping landing pages.
+    The 'eager' page load strategy returns control once the DOM is ready instead of waiting on every image and stylesheet.
+    """
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = 'eager'
+    options.add_argument('--headless=new')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    return options
+
+
+async def scrape(source: str, urls: tuple[str, ...], driver: webdriver.Chrome=None) -> None:
+    """
+    Scrape a source's state landing pages and save the results to a CSV, unless we already have them.
 
+    NOTE get_urls makes blocking requests and Selenium calls, so it's run in its own thread and event loop.
+    This lets the sources actually scrape at the same time when they're gathered.
 
-    next_step("Step 2. Scrape American Legal URLs and save to csv.", stop=True)
+    Args:
+        source (str): A key in LEGAL_WEBSITE_DICT.
+        urls (tuple[str, ...]): The source's state landing page URLs.
+        driver (webdriver.Chrome, Optional): A Selenium driver, for sources that need one. Defaults to None.
+    """
     file = make_csv_file_path_with_cwd(source)
-    if not os.path.exists(am_legal_file):
-        am_legal_results = await get_urls(am_legal_urls, source=source)
-        logger.info(f"Got {len(am_legal_results)} URLs. Saving to csv...")
-        save_to_csv(am_legal_results, file)
-    else:
-        logger.info("Already got URLs from American Legal.")
+    if os.path.exists(file):
+        logger.info(f"Already got URLs from {source}.")
+        return
+
+    results = await asyncio.to_thread(asyncio.run, get_urls(urls, source=source, driver=driver))
+
+    logger.info(f"Got {len(results)} URLs from {source}. Saving to csv...")
+    match source:
+        case "american_legal":
+            save_to_csv(results, file)
+        case "municode":
+            assert len(results) == 50, f"We haven't gotten all the states yet! We've only got {len(results)}"
+            save_urls_to_csv(source)
+        case _:
+            save_urls_to_csv(source)
+
+
+async def scrape_with_shared_driver(urls_by_source: dict[str, tuple[str, ...]]) -> None:
+    """
+    Scrape several Selenium sources one after another with a single Chrome instance.
+    NOTE Selenium drivers aren't thread-safe, so the sources sharing it can't run at the same time.
+    """
+    urls_by_source = {
+        source: urls for source, urls in urls_by_source.items() 
+        if not os.path.exists(make_csv_file_path_with_cwd(source))
+    }
+    if not urls_by_source:
+        logger.info(f"Already got URLs from all Selenium sources.")
+        return
+
+    driver = webdriver.Chrome(options=_make_chrome_options())
+    try:
+        for source, urls in urls_by_source.items():
+            await scrape(source, urls, driver=driver)
+    finally:
+        driver.quit()
+
+
+async def main():
+
+    logger.info("Step 1. Make American Legal URLs.",f=True)
+    am_legal_urls = make_urls("american_legal")
+    logger.info("Made American legal URLs.")
 
 
     # NOTE Vermont, Virginia, Washington are the only holdouts.
     next_step("Step 3. Make Municode URLs")
-    source = "municode"
-    municode_urls = make_urls(source)
+    municode_urls = make_urls("municode")
     logger.info("Made Municode URLs.")
 
 
-    # NOTE Municode is a bitch with downloading these all at once, but just keep running it over and over. You'll get them all eventually.
-    next_step("Step 4. Scrape Municode URLs and save to csv.")
-    file = make_csv_file_path_with_cwd(source)
-    if not os.path.exists(file):
-        driver = webdriver.Chrome()
-        municode_results = await get_urls(municode_urls, driver=driver, source=source)
-        assert len(municode_results) == 50, f"We haven't gotten all the states yet! We've only got {len(municode_results)}"
-        save_urls_to_csv(municode_results, file)
-    else:
-        logger.info("Already got URLs from Municode.")
-
-
     next_step("Step 5. Make General Code URLs.") 
-    source = "general_code"
-    gc_urls = make_urls(source)
+    gc_urls = make_urls("general_code")
     logger.info("Made General Code URLs.")
 
 
-    next_step("Step 6. Scrape General Code URLs and save to csv.") 
-    file = make_csv_file_path_with_cwd(source)
-    if not os.path.exists(file):
-        driver = webdriver.Chrome()
-        gc_results = await get_urls(gc_urls, source=source, driver=driver)
-        save_urls_to_csv(gc_results, file)
-    else:
-        logger.info(f"Already got URLs from {source}.")
+    # NOTE Municode is a bitch with downloading these all at once, but just keep running it over and over. You'll get them all eventually.
+    next_step("Step 2, 4, 6. Scrape American Legal, Municode, and General Code URLs concurrently and save them to csv.", stop=True)
+    await asyncio.gather(
+        scrape("american_legal", am_legal_urls),
+        scrape_with_shared_driver({"municode": municode_urls, "general_code": gc_urls}),
+    )
 
 
     next_step("Step 7. Check if we got all CSV files for all source sites. If we do, merge and save them to a CSV.")
@@ -192,18 +294,12 @@ async def main():
 
 
     next_step("Step 8. Attach sources and state_code to sources.")
-    sources = load_from_csv(f"{source}_results.csv")
-    fixed_sources = [
-        get_state_code_from_url(get_source_from_url_and_href(source)) for source in sources
-    ]
+    sources_df = load_from_csv(f"{source}_results.csv", return_df=True)
+    sources_df = add_source_and_state_code(sources_df)
 
 
-    next_step("Step 9. Concatenate URL with href if href starts with '/', then turn it into a pandas Dataframe.")
-    sources_with_fixed_href = [
-        {**dic, 'href': dic['url'] + dic['href'] if dic['href'].startswith('/') else dic['href']}
-        for dic in fixed_sources
-    ]
-    sources_df = pd.DataFrame.from_dict(sources_with_fixed_href)
+    next_step("Step 9. Concatenate URL with href if href starts with '/'.")
+    sources_df = fix_relative_hrefs(sources_df)
     logger.debug(f"sources_df: {sources_df.head()}")
 
 
@@ -211,7 +307,7 @@ async def main():
     async with MySqlDatabase(database="socialtoolkit") as db:
         location_df = await db.async_query_to_dataframe("""
             SELECT gnis, place_name, class_code, state_code FROM locations;
-        """)
+        """, dtype_backend="pyarrow")
         #logger.debug(f"locations_df: {location_df.head()}")
 
         next_step("Step 11. Match href URLs to their associated cities.")
@@ -221,11 +317,10 @@ async def main():
             output_df = matcher.match()
             logger.debug(f"output_head: {output_df.head()}")
             logger.debug(f"output_df: {output_df}")
-            time.sleep(30)
+            await asyncio.sleep(30)
         else:
             logger.info(f"Already matched URLs to their places.")
-            output_df = load_from_csv(output_df_path)
-            output_df = pd.DataFrame.from_records(output_df)
+            output_df = load_from_csv(output_df_path, return_df=True)
             logger.debug(f"output_head: {output_df.head()}")
 
 
@@ -234,27 +329,24 @@ async def main():
 
 
         next_step("Step 13. Insert output_df into table 'sources' in the MySQL database.")
-        output_list_of_dicts = output_df.to_dict('records') 
-        logger.debug(f"output_list_of_dicts\n{output_list_of_dicts[0:10]}")
+        # Feed the rows to the database as positional tuples in column order, with missing values as None.
+        insert_df = output_df[_INSERT_COLUMN_NAMES]
+        insert_df = insert_df.astype(object).where(insert_df.notna(), None)
+        output_rows = insert_df.to_records(index=False).tolist()
+        logger.debug(f"output_rows\n{output_rows[0:10]}")
 
 
-        update_column_names = ["source_municode", "source_general_code", "source_american_legal", "source_code_publishing_co"]
-        update_placeholder = [
-            f"{column} = VALUES({column})" for column in update_column_names
-        ]
-        columns = ["gnis", "place_name", "state_code", "source_municode", "source_general_code", "source_american_legal", "source_code_publishing_co"]
         args = {
-            "columns": ", ".join(columns),
-            "placeholders": return_s_percent(columns),
-            "update": ", ".join(update_placeholder)
+            "columns": SOURCES_INSERT_COLUMNS,
+            "update": SOURCES_UPDATE_CLAUSE
         }
-        await db.async_execute_sql_command(
+        await db.async_insert_multi_row(
             """
-            INSERT INTO sources ({columns}) VALUES({placeholders})
+            INSERT INTO sources ({columns}) VALUES {values}
             ON DUPLICATE KEY UPDATE
             {update};
             """,
-            params=output_list_of_dicts,
+            output_rows,
             args=args
         )
         logger.info("Insert successful!")
@@ -9,7 +9,14 @@ from typing import NamedTuple, Never, Self, Generator, AsyncGenerator
 
 import abc
 
+import aiohttp
 import pandas as pd
+try:
+    # NOTE uvloop is a faster drop-in event loop, but it doesn't run on Windows.
+    # If it's not installed, we fall back to asyncio's default loop.
+    from uvloop import new_event_loop
+except ImportError:
+    new_event_loop = None
 from playwright.async_api import (
     async_playwright,
     Playwright as AsyncPlaywright,
@@ -17,161 +24,79 @@ from playwright.async_api import (
     Page as AsyncPlaywrightPage,
     TimeoutError as AsyncPlaywrightTimeoutError,
 )
-from playwright.sync_api import (
-    sync_playwright,
-    Playwright,
-    Browser as PlaywrightBrowser,
-    Page as PlaywrightPage,
-    TimeoutError as PlaywrightTimeoutError,
-)
 
 # Insert the top-level directory as a filepath to prevent import errors. We'll see if it works.
+# NOTE This is only needed when this file is run as a script, so it's skipped if the directory is already there.
 insert_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-sys.path.insert(0,insert_path)
+if insert_path not in sys.path:
+    sys.path.insert(0,insert_path)
 
 from database.database import MySqlDatabase
 
-from config.config import OUTPUT_FOLDER, LEGAL_WEBSITE_DICT, HEADLESS, SLOW_MO
+from config.config import OUTPUT_FOLDER, LEGAL_WEBSITE_DICT, HEADLESS, SLOW_MO, CONCURRENCY_LIMIT, CDP_ENDPOINT, LOAD_DATA_THRESHOLD
 
 from logger.logger import Logger
 logger = Logger(logger_name=__name__)
 
 # TODO Figure out what the hell is up with these imports.
 from utils.shared.next_step import next_step
+from utils.database.get_column_names import get_column_names
 from utils.manual.scrape_legal_websites_utils.get_robots_txt_url import get_robots_txt_url
 from utils.manual.scrape_legal_websites_utils.get_locations import get_locations
-from utils.manual.scrape_legal_websites_utils.match_urls_to_locations import match_urls_to_locations
+from utils.manual.scrape_legal_websites_utils.get_location_state_codes import get_location_state_codes
+from utils.manual.scrape_legal_websites_utils.match_urls_to_locations import match_urls_to_locations, MATCHED_URL_COLUMNS
 
 
 from manual.scraper_base_class.PlaywrightAsyncScraper import AsyncScraper
 
-# state_urls_df = pd.DataFrame.from_records(state_url_list, columns=["state_code", "state_url"])
-# locations_df = locations_df.merge(state_urls_df, on="state_code", how="inner")
-
-# locations_df.join(state_urls_df, on="state_code", how="inner")
-# logger.debug(f"locations_df\n{locations_df.head()}",f=True)
-
-
-LEGAL_WEBSITE_DICT = {
-    "american_legal": {
-        "base_url": "https://codelibrary.amlegal.com/regions/",
-        "target_class": "browse-link roboto",
-        "wait_in_seconds": 5,
-        "robots_txt": "https://codelibrary.amlegal.com/robots.txt",
-        "source": "american_legal",
-    },
-    "municode": {
-        "base_url": "https://library.municode.com/",
-        "target_class": "index-link",
-        "wait_in_seconds": 15,
-        "robots_txt": "https://municode.com/robots.txt",
-        "source": "municode",
-    },
-    "general_code" : {
-        "base_url": "https://www.generalcode.com/source-library/?state=",
-        "target_class": "codeLink",
-        "wait_in_seconds": 0,
-        "robots_txt": "https://www.generalcode.com/robots.txt",
-        "source": "general_code",
-    },
-}
-
-
-
-class GeneralCodeScraper(AsyncScraper):
-    """
-    Parameters:
-        pw_instance (AsyncPlaywright): An Async Playwright Instance
-        robots_txt_url (str): A URL for a site's robots.txt. Defaults to self.site_dict['robots_txt']
-        **launch_kwargs: Keyword arguments to be passed to `playwright.chromium.launch`.
-    """
-
-    def __init__(self, pw_instance, robots_txt_url:str=None, **launch_kwargs):
-        # Initialize the child class attributes
-        self.scrape_url_length = 52
-        self.site_dict = LEGAL_WEBSITE_DICT['general_code_co'] or None
-        self.type_check_site_dict(self, __class__.__qualname__, robots_txt_url=robots_txt_url)
+# Number of rows in each multi-row INSERT statement sent by insert_into_sources.
+SOURCES_INSERT_BATCH_SIZE = 5000
 
-        # Initialize the parent class attributes
-        super().__init__(pw_instance, robots_txt_url=robots_txt_url, **launch_kwargs)
+# Name of the CSV the merged output of main() is saved to, and how many rows are written to it at a time.
+OUTPUT_CSV_FILENAME = "legal_website_urls.csv.gz"
+OUTPUT_CSV_CHUNK_SIZE = 50_000
 
-
-    def _build_url(self, state_code: str) -> str:
-        """
-        Build General Code Co-specific URLs.
-        NOTE: The URL must be 52 characters long.
-        Example Output:
-            https://www.generalcode.com/source-library/?state=AZ
-        """
-        # Get URL components from legal_website_dict
-        logger.debug(f"Creating URLs for state_code '{state_code}'...")
-        scrape_url = f"{self.base_url}{state_code}" # -> "https://www.generalcode.com/source-library/?state=AZ"
-        scrape_url = self.check_url_length(scrape_url)
-        return scrape_url
+# How long the shared HTTP session keeps idle connections open for reuse.
+SESSION_KEEPALIVE_IN_SECONDS = 30
 
 
-class AmericanLegalScraper(AsyncScraper):
+class LegalWebsiteScraper(AsyncScraper):
     """
-    Parameters:
-        pw_instance (AsyncPlaywright): An Async Playwright Instance
-        robots_txt_url (str): A URL for a site's robots.txt. Defaults to self.site_dict['robots_txt']
-        **launch_kwargs: Keyword arguments to be passed to `playwright.chromium.launch`.
-    """
-
-    def __init__(self, pw_instance, robots_txt_url:str=None, **launch_kwargs):
-        # Initialize the child class attributes
-        self.scrape_url_length = 42
-        self.site_dict = LEGAL_WEBSITE_DICT['american_legal'] or None
-        self.type_check_site_dict(self, __class__.__qualname__, robots_txt_url=robots_txt_url)
-
-        # Initialize the parent class attributes
-        super().__init__(pw_instance, robots_txt_url, **launch_kwargs)
+    Scrape a legal website using its settings in LEGAL_WEBSITE_DICT.
 
-
-    def _build_url(self, state_code: str) -> str:
-        """
-        Build  American Legal-specific URLs.
-        NOTE: The URL must be 52 characters long.
-        Example Output:
-            https://www.generalcode.com/source-library/?state=AZ
-        """
-        scrape_url = f"{self.base_url}{state_code.lower()}" # -> "https://codelibrary.amlegal.com/regions/az"
-
-        logger.debug(f"Creating URLs for state_code '{state_code}'...")
-        scrape_url = self.check_url_length(scrape_url)
-        return scrape_url
-
-
-class MunicodeScraper(AsyncScraper):
-    """
     Parameters:
+        site (str): The site's key in LEGAL_WEBSITE_DICT, e.g. 'municode', 'american_legal', or 'general_code'.
         pw_instance (AsyncPlaywright): An Async Playwright Instance
         robots_txt_url (str): A URL for a site's robots.txt. Defaults to self.site_dict['robots_txt']
+        browser (AsyncPlaywrightBrowser): A shared browser to open pages in. If None, the scraper launches its own.
+        session (aiohttp.ClientSession): A shared HTTP session for fetching robots.txt. If None, a session is made per fetch.
         **launch_kwargs: Keyword arguments to be passed to `playwright.chromium.launch`.
     """
 
-    def __init__(self, pw_instance, robots_txt_url:str=None, **launch_kwargs):
-        # Initialize the child class attributes
-        self.scrape_url_length = 31
-        self.site_dict = LEGAL_WEBSITE_DICT['municode'] or None
-        self.type_check_site_dict(self, __class__.__qualname__, robots_txt_url=robots_txt_url)
+    def __init__(self, site: str, pw_instance, robots_txt_url:str=None, browser: AsyncPlaywrightBrowser=None, session: aiohttp.ClientSession=None, **launch_kwargs):
+        # Initialize and check the site-specific attributes
+        self.site_dict = LEGAL_WEBSITE_DICT.get(site)
+        self.type_check_site_dict(site, robots_txt_url=robots_txt_url)
+        self.scrape_url_length: int = self.site_dict['scrape_url_length']
+        self.lowercase_state_code: bool = self.site_dict['lowercase_state_code']
 
         # Initialize the parent class attributes
-        super().__init__(pw_instance, robots_txt_url=robots_txt_url, **launch_kwargs)
+        super().__init__(pw_instance, robots_txt_url=robots_txt_url, browser=browser, session=session, **launch_kwargs)
 
 
-    def _build_url(self, state_code: str) -> str:
+    def _build_urls(self, state_codes: pd.Series) -> pd.Series:
         """
-        Build  Municode-specific URLs.
-        NOTE: The URL must be 32 characters long.
+        Build site-specific URLs.
+        NOTE: The URLs must be self.scrape_url_length characters long.
         Example Output:
             https://library.municode.com/az
+            https://codelibrary.amlegal.com/regions/az
+            https://www.generalcode.com/source-library/?state=AZ
         """
-        scrape_url = f"{self.base_url}/{state_code.lower()}" # -> https://library.municode.com/az
-
-        logger.debug(f"Creating URLs for state_code '{state_code}'...")
-        scrape_url = self.check_url_length(scrape_url)
-        return scrape_url
+        logger.debug(f"Creating URLs for {len(state_codes)} state_codes...")
+        if self.lowercase_state_code:
+            state_codes = state_codes.str.lower()
+        return self.base_url + state_codes
 
 
 async def insert_into_sources(output_df: pd.DataFrame, db: MySqlDatabase) -> None:
@@ -191,79 +116,138 @@ async def insert_into_sources(output_df: pd.DataFrame, db: MySqlDatabase) -> Non
     ```
     """
     column_names = output_df.columns.to_list()
-    insert_list = [
-        row for row in output_df.itertuples(index=False, named=None)
-    ]
-    db.async_insert_by_batch(insert_list, columns=column_names, table="sources", update=True)
+    args = {
+        "columns": get_column_names(column_names),
+        "update": ", ".join(f"{column} = VALUES({column})" for column in column_names),
+    }
+    # NOTE Turn NaN into NULL, then let numpy build the row tuples in C with to_records().tolist(),
+    # instead of going through itertuples.
+    insert_df = output_df.astype(object).where(output_df.notna(), None)
+    insert_list = insert_df.to_records(index=False).tolist()
+
+    # NOTE Large outputs are loaded with LOAD DATA LOCAL INFILE, since it's much faster than any INSERT.
+    if len(insert_list) >= LOAD_DATA_THRESHOLD:
+        try:
+            await db.async_upsert_via_load_data(insert_list, table="sources", bulk_load_session=True, **args)
+            return
+        except Exception as e:
+            logger.warning(f"LOAD DATA LOCAL INFILE upsert failed: {e}\nFalling back to multi-row INSERT...")
+
+    await db.async_insert_multi_row(
+        "INSERT INTO sources ({columns}) VALUES {values} ON DUPLICATE KEY UPDATE {update};",
+        insert_list,
+        args=args,
+        batch_size=SOURCES_INSERT_BATCH_SIZE,
+        single_transaction=True,
+        bulk_load_session=True
+    )
     return
 
 
 async def scrape_site(db: MySqlDatabase, 
-                      scraper: AsyncScraper, 
-                      site_df_list: list, 
-                      locations_df: pd.DataFrame=None, 
-                      headless: bool=True, 
-                      slow_mo: int=1
-                     ) -> None:
+                      site: str,
+                      robots_txt_url: str,
+                      pw_instance: AsyncPlaywright,
+                      browser: AsyncPlaywrightBrowser,
+                      session: aiohttp.ClientSession,
+                      locations_task: asyncio.Task[pd.DataFrame]=None, 
+                     ) -> pd.DataFrame:
     """
-    Scrape a website using Playwright
+    Scrape a website using Playwright, and return its URLs matched to the locations from locations_task.
+    NOTE The browser and HTTP session are shared between scrapers. Each scraper opens its own context in the browser.
+    The locations are only awaited once the site has been scraped, so the scrape doesn't wait on reading the whole table.
     """
-    # Get the robots.txt file
-    scraper_name =scraper.__qualname__
-    logger.debug(f"robots_txt_url for {scraper}: {get_robots_txt_url(scraper_name)}")
+    logger.debug(f"robots_txt_url for {site}: {robots_txt_url}")
 
     # Create an exit stack.
     async with AsyncExitStack() as stack:
-        # Create a playwright instance within the stack.
-        pw_instance = await stack.enter_async_context(async_playwright())
-        logger.info(f"Playwright instance for {scraper_name} instantiated successfully")
-
         # Instantiate each scraper.
-        scraper_instance: AsyncScraper = await stack.enter_async_context(
-            scraper(pw_instance, robots_txt_url=get_robots_txt_url(scraper_name), headless=headless, slow_mo=slow_mo)
+        scraper_instance: LegalWebsiteScraper = await stack.enter_async_context(
+            LegalWebsiteScraper(site, pw_instance, robots_txt_url=robots_txt_url, browser=browser, session=session)
         )
 
-        # Build URL paths for each domain.
-        urls: list[dict[str,str]] = await scraper_instance.build_urls(locations_df)
+        # Build URL paths for each state that has locations.
+        state_codes: list[str] = await get_location_state_codes(db)
+        urls: list[dict[str,str]] = scraper_instance.build_urls(state_codes)
 
         # Scrape each domain and return the URLs and their associated text.
-        sites_df: pd.DataFrame = await scraper_instance.scrape(locations_df, urls, db)
+        sites_df: pd.DataFrame = await scraper_instance.scrape(urls, db)
 
-        # Match the URLs and text with the locations in locations_df.
-        results: pd.DataFrame  = match_urls_to_locations(locations_df, sites_df)
+    # Match the URLs and text with the locations.
+    locations_df: pd.DataFrame = await locations_task
+    results: pd.DataFrame  = match_urls_to_locations(locations_df, sites_df)
 
-    logger.info(f"scraper {scraper_name} has completed its scrape. It returned {len(results)} URLs. Adding to site_df_list list...")
-    site_df_list.append(results)
+    logger.info(f"scraper for {site} has completed its scrape. It returned {len(results)} URLs.")
+    return results
 
 
 async def scrape_legal_websites(db: MySqlDatabase,
                                 site_df_list: list[None],
-                                scraper_list: list[AsyncScraper],
-                                locations_df: pd.DataFrame=None,
+                                site_list: list[str],
+                                locations_task: asyncio.Task[pd.DataFrame]=None,
                                 headless: bool=True,
-                                slow_mo: int=100
+                                slow_mo: int=100,
+                                cdp_endpoint: str=None
                                 ) -> list[pd.DataFrame]:
     """
-    Scrape legal websites concurrently using site-specific AsyncScraper classes.
+    Scrape legal websites concurrently, with one LegalWebsiteScraper per site.
 
     Args:
         db (MySqlDatabase): The database connection object.
         site_df_list (list[None]): An empty list that will be populated with DataFrames containing the scraped data from each site.
-        scraper_list (list[AsyncScraper]): A list of AsyncScraper classes, each representing a different legal website to be scraped.
+        site_list (list[str]): A list of LEGAL_WEBSITE_DICT keys, each representing a different legal website to be scraped.
+        locations_task (asyncio.Task[pd.DataFrame]): A task reading the locations table. It's shared by every site's scraper.
         headless (bool, optional): Whether to run the browser in headless mode. Defaults to True.
         slow_mo (int, optional): The number of milliseconds to wait between actions. Defaults to 100.
+        cdp_endpoint (str, optional): The CDP endpoint of a running Chromium to connect to instead of launching one. Defaults to None.
 
     Returns:
         list[pd.DataFrame]: A list of pandas DataFrames, each containing the scraped data from a legal website.
     """
     outer_task_name = asyncio.current_task().get_name()
-    scrapes = [
-        asyncio.create_task(
-            scrape_site(db, scraper, site_df_list, locations_df=locations_df, headless=headless, slow_mo=slow_mo),
-            name=f"{outer_task_name}_{scraper.__qualname__}"
-        ) for scraper in scraper_list
-    ]
-    await asyncio.gather(*scrapes) # -> list[dict]
+
+    # NOTE Start Playwright and launch Chromium once, rather than once per scraper.
+    async with AsyncExitStack() as stack:
+        pw_instance = await stack.enter_async_context(async_playwright())
+        if cdp_endpoint:
+            # NOTE Attach to an already-running Chromium, so several processes can share its subprocesses.
+            # Closing a connected browser only disconnects from it.
+            browser: AsyncPlaywrightBrowser = await stack.enter_async_context(
+                await pw_instance.chromium.connect_over_cdp(cdp_endpoint, slow_mo=slow_mo)
+            )
+        else:
+            browser: AsyncPlaywrightBrowser = await stack.enter_async_context(
+                await pw_instance.chromium.launch(headless=headless, slow_mo=slow_mo)
+            )
+        logger.info("Playwright instance and browser instantiated successfully")
+        session = await stack.enter_async_context(
+            aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=CONCURRENCY_LIMIT, keepalive_timeout=SESSION_KEEPALIVE_IN_SECONDS)
+            )
+        )
+
+        # Look up each site's robots.txt URL once, before making the tasks.
+        scraper_meta = [
+            (site, get_robots_txt_url(site)) for site in site_list
+        ]
+        # NOTE Exceptions are returned instead of raised, so one site failing doesn't cancel the others.
+        tasks = [
+            asyncio.create_task(
+                scrape_site(db, site, robots_txt_url, pw_instance, browser, session, locations_task=locations_task),
+                name=f"{outer_task_name}_{site}"
+            ) for site, robots_txt_url in scraper_meta
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # NOTE Results are added in site_list order, not the order the sites finished in,
+    # so the columns they get when they're joined in main are the same every run.
+    # A site that failed is added as an empty frame with the same columns, so the other sites keep their place
+    # and the output has the same columns every run.
+    for (site, _), result in zip(scraper_meta, results):
+        if isinstance(result, BaseException):
+            logger.error(f"scraper for {site} failed: {result}")
+            result = pd.DataFrame(columns=MATCHED_URL_COLUMNS)
+        site_df_list.append(result)
     return site_df_list
 
 
@@ -271,11 +255,11 @@ async def scrape_legal_websites(db: MySqlDatabase,
 
 async def main():
 
-    # Step 1. Define the website-specific scraping classes and output list.
-    scraper_list = [
-        #MunicodeScraper,
-        #AmericanLegalScraper,
-        GeneralCodeScraper,
+    # Step 1. Define the websites to scrape and output list.
+    site_list = [
+        #"municode",
+        #"american_legal",
+        "general_code",
     ]
     site_df_list = []
 
@@ -283,23 +267,34 @@ async def main():
     # Step 2. Use Playwright to scrape the websites for its URLs
     async with MySqlDatabase(database="socialtoolkit") as db:
 
-        # Get the locations dataframe
-        locations_df = await get_locations(db)
-        logger.debug(f"locations_df: {locations_df.head()}\ndtypes: {locations_df.dtypes}")
+        # Start reading the locations dataframe.
+        # NOTE It's read in the background while the sites are scraped, since it's only needed to match their links.
+        locations_task = asyncio.create_task(get_locations(db))
 
-        site_df_list = await scrape_legal_websites(db, site_df_list, scraper_list, 
-                                                   locations_df=locations_df, headless=HEADLESS, slow_mo=SLOW_MO)
+        site_df_list = await scrape_legal_websites(db, site_df_list, site_list, 
+                                                   locations_task=locations_task, headless=HEADLESS, slow_mo=SLOW_MO,
+                                                   cdp_endpoint=CDP_ENDPOINT)
+        # NOTE This also makes sure the read is finished before the database closes, even if every scraper failed.
+        locations_df = await locations_task
+        logger.debug(f"locations_df: {locations_df.head()}\ndtypes: {locations_df.dtypes}")
 
         next_step(step=3, stop=True)
     # Step 3. Merge the 3 dataframes into 1.
-        output_df: pd.DataFrame = site_df_list.pop(0)
-        for df in site_df_list[1:]:
-            output_df = output_df.merge(df, on="gnis", how="left")
+        # NOTE Index every site's results on gnis once, then left-join them all onto every location's gnis in one call,
+        # instead of merging them one at a time. Joining onto the locations rather than the first site's results
+        # means a site that failed or matched nothing doesn't drop the other sites' matches.
+        # Columns are suffixed with the site's position in site_df_list, since every site has the same column names.
+        site_dfs = [df.set_index("gnis").add_suffix(f"_{idx}") for idx, df in enumerate(site_df_list)]
+        output_df: pd.DataFrame = locations_df[["gnis"]].set_index("gnis").join(site_dfs, how="left")
+        output_df = output_df.reset_index()
 
 
     next_step(step=4, stop=True)
     # Step 4. Output the URLs to a csv.
-    output_df.to_csv(OUTPUT_FOLDER)
+    # NOTE The CSV is gzipped and written in chunks, since the URL columns are long and repetitive.
+    output_df.to_csv(
+        os.path.join(OUTPUT_FOLDER, OUTPUT_CSV_FILENAME), index=False, chunksize=OUTPUT_CSV_CHUNK_SIZE, compression="gzip"
+    )
 
 
     next_step(step=5, stop=True)
@@ -320,7 +315,8 @@ if __name__ == "__main__":
     base_name = os.path.basename(__file__) 
     program_name = base_name if base_name != "main.py" else os.path.dirname(__file__)
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         print(f"{program_name} program stopped.")
 
@@ -3,11 +3,14 @@ import asyncio
 import os
 import re
 import traceback
-from typing import Any, AsyncGenerator, Never
+from typing import Any, AsyncGenerator, Mapping, Never
+from urllib.parse import urlparse
 
 import abc
 from abc import ABC, abstractmethod
 
+import aiohttp
+from lxml.etree import ParserError as LxmlParserError
 import pandas as pd
 from playwright.async_api import (
     Playwright as AsyncPlaywright,
@@ -15,14 +18,18 @@ from playwright.async_api import (
     Page as AsyncPlaywrightPage,
     BrowserContext as AsyncPlaywrightBrowserContext,
     TimeoutError as AsyncPlaywrightTimeoutError,
+    Route as AsyncPlaywrightRoute,
+    Response as AsyncPlaywrightResponse,
 )
 
 from utils.manual.scrape_legal_websites_utils.extract_urls_using_javascript import async_extract_urls_using_javascript
+from utils.manual.scrape_legal_websites_utils.extract_urls_from_html import extract_urls_from_html
 from utils.manual.scrape_legal_websites_utils.fetch_robots_txt import async_fetch_robots_txt
 from utils.manual.scrape_legal_websites_utils.parse_robots_txt import parse_robots_txt 
 from utils.manual.scrape_legal_websites_utils.can_fetch import can_fetch
+from utils.manual.scrape_legal_websites_utils.parse_retry_after import parse_retry_after
 
-from config.config import LEGAL_WEBSITE_DICT, CONCURRENCY_LIMIT, OUTPUT_FOLDER
+from config.config import LEGAL_WEBSITE_DICT, CONCURRENCY_LIMIT, MAX_OPEN_PAGES, OUTPUT_FOLDER, US_STATE_CODES
 
 from database.database import MySqlDatabase
 
@@ -30,12 +37,48 @@ from logger.logger import Logger
 logger = Logger(logger_name=__name__)
 
 
+# NOTE This is shared by every scraper, so the total number of open pages stays bounded
+# no matter how many scrapers are running at once. self.semaphore still limits each site separately.
+PAGE_SEMAPHORE = asyncio.Semaphore(MAX_OPEN_PAGES)
+
+# Maximum number of URLs whose scrape results each scraper keeps in memory.
+SCRAPE_CACHE_SIZE = 512
+
+# Parsed robots.txt rules, keyed by robots.txt URL, so each site's file is only fetched and parsed once per process.
+ROBOT_RULES_CACHE: dict[str, dict[str, Any]] = {}
+
+# The only kinds of requests needed to get a page's links. Everything else is aborted before it goes out.
+ALLOWED_RESOURCE_TYPES = frozenset({"document", "script", "xhr", "fetch"})
+# Ad and analytics hosts, which are aborted even when they're scripts.
+BLOCKED_HOST_SUBSTRINGS = (
+    "google-analytics", "googletagmanager", "googlesyndication", "doubleclick", "adservice",
+    "facebook", "hotjar", "newrelic", "nr-data", "quantserve", "scorecardresearch",
+)
+
+# How long to wait for a page's links to show up before giving up on it.
+# NOTE Municode is the slowest site, and its wait_in_seconds is 15.
+READY_SELECTOR_TIMEOUT_IN_MS = 15_000
+
+# How long to wait for a plain HTTP GET of a page before falling back to the browser.
+HTTP_EXTRACT_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Response statuses where the site is telling us to slow down, and may say for how long in Retry-After.
+RATE_LIMITED_STATUSES = frozenset({429, 503})
+
+
+
 class PlaywrightAsyncScraper:
 
+    # Child Class attributes
+    site_dict: Mapping[str, Any] = None
+    scrape_url_length: int = None
+
     def __init__(self,
                  pw_instance: AsyncPlaywright,
                  robots_txt_url: str=None,
                  user_agent: str="*",
+                 browser: AsyncPlaywrightBrowser=None,
+                 session: aiohttp.ClientSession=None,
                  **launch_kwargs):
         # Parent Class Parameters
         self.pw_instance: AsyncPlaywright = pw_instance
@@ -45,17 +88,38 @@ class PlaywrightAsyncScraper:
 
         # Attributes initialized from functions
         self.semaphore: asyncio.Semaphore = asyncio.Semaphore(CONCURRENCY_LIMIT)  # Currently set to 2.
-        self.browser: AsyncPlaywrightBrowser = None
+        # NOTE If a browser is passed in, it's shared with other scrapers, so this scraper doesn't launch or close it.
+        self.browser: AsyncPlaywrightBrowser = browser
+        self.owns_browser: bool = browser is None
+        # NOTE Each context holds one page that's reused from URL to URL,
+        # so pages open at the same time don't share cookies or storage, and pages aren't opened per URL.
+        self.contexts: list[AsyncPlaywrightBrowserContext] = []
+        self.page_pool: asyncio.Queue[AsyncPlaywrightPage] = None
+        # NOTE A shared HTTP session for plain requests like robots.txt, so they don't each open their own connection pool.
+        # If one isn't passed in, the scraper opens its own when it starts, and closes it on exit.
+        self.session: aiohttp.ClientSession = session
+        self.owns_session: bool = session is None
         self.robot_rules: dict[str, dict[str, Any]] = {}
+        # NOTE Event loop time until which this site asked us to stop sending requests. See _on_response.
+        self.retry_after_until: float = 0.0
+        # NOTE Event loop time at which the next fetch to this site may start, so fetches are spaced by the crawl delay.
+        self.next_fetch_time: float = 0.0
+        # NOTE Whether this site's links are in the HTML it serves, so they can be had with a plain GET instead of a browser.
+        # None until the first page is checked. See _async_try_http_extract.
+        self.links_in_html: bool | None = None
+        self.scrape_tasks: dict[str, asyncio.Task] = {}
 
-        # Child Class attributes
-        self.site_dict: dict = None
-        self.scrape_url_length: int = None
         # Site-dictionary attributes.
         self.source: str = self.site_dict['source']
         self.base_url: str = self.site_dict['base_url']
         self.target_class: str = self.site_dict['target_class']
+        # NOTE target_class can have more than one class in it (e.g. 'browse-link roboto'), so each one gets its own '.'.
+        self.target_selector: str = self.site_dict.get('ready_selector') or "a." + ".".join(self.target_class.split())
         self.robots_txt_url: str = robots_txt_url or self.site_dict['robots_txt']
+        # NOTE The site's domain without its subdomain (e.g. 'municode.com'), so requests to e.g. its API host count as the same site.
+        self.site_domain: str = ".".join(urlparse(self.base_url).hostname.split(".")[-2:])
+        # NOTE The base URL and URL length are fixed per site, so every state's URL is built and checked once here.
+        self.url_map: dict[str, str] = self._make_url_map(US_STATE_CODES)
 
 
     def type_check_site_dict(self, child_class_name: str, robots_txt_url: str=None) -> None:
@@ -77,44 +141,158 @@ class PlaywrightAsyncScraper:
     async def async_get_robot_rules(self, robots_txt_url) -> None:
         """
         Asynchronously Get the site's robots.txt file and assign it to the robot_urls attribute
+        NOTE The parsed rules are cached in ROBOT_RULES_CACHE, so later scrapers for the same site skip the fetch.
         """
-        robots_txt = await async_fetch_robots_txt(robots_txt_url)
-        rules: dict[str,dict[str|Any]] = parse_robots_txt(robots_txt)
-        self.robot_rules = rules
+        rules = ROBOT_RULES_CACHE.get(robots_txt_url)
+        if rules is None:
+            robots_txt = await async_fetch_robots_txt(robots_txt_url, session=self.session)
+            rules: dict[str,dict[str|Any]] = parse_robots_txt(robots_txt)
+            ROBOT_RULES_CACHE[robots_txt_url] = rules
+        # Use the rules for our user agent, falling back to the ones for every agent.
+        self.robot_rules = rules.get(self.user_agent.lower()) or rules.get('*', {})
 
 
     async def _async_load_browser(self) -> None:
         """
-        Asynchronously launch a chromium instance and load a page
+        Asynchronously launch a chromium instance if one wasn't passed in,
+        then open the pool of browser contexts and pages that this scraper uses.
+        NOTE There's one context and page per page this scraper can have open at once (see self.semaphore).
+        """
+        if self.owns_browser:
+            self.browser = await self.pw_instance.chromium.launch(**self.launch_kwargs)
+        self.contexts = [await self._async_make_context() for _ in range(CONCURRENCY_LIMIT)]
+        self.page_pool = asyncio.Queue()
+        for context in self.contexts:
+            self.page_pool.put_nowait(await self._async_make_page(context))
+
+
+    async def _async_make_context(self) -> AsyncPlaywrightBrowserContext:
+        """
+        Open a browser context that aborts requests we don't need.
+        """
+        context = await self.browser.new_context(
+            service_workers="block", # Service workers can fetch resources without going through the route below.
+            viewport={"width": 800, "height": 600}
+        )
+        await context.route("**/*", self._async_block_resources)
+        context.on("response", self._on_response)
+        return context
+
+
+    def _on_response(self, response: AsyncPlaywrightResponse) -> None:
+        """
+        If the site rate-limits any request, pause this scraper's fetches for as long as its Retry-After header says.
         """
-        self.browser = await self.pw_instance.chromium.launch(**self.launch_kwargs)
+        self._pause_if_rate_limited(response.status, response.headers.get("retry-after"), response.url)
+
+
+    def _pause_if_rate_limited(self, status: int, retry_after: str | None, url: str) -> None:
+        """
+        If a response's status says we're being rate-limited, pause this scraper's fetches for as long as Retry-After says.
+        """
+        if status in RATE_LIMITED_STATUSES:
+            wait_in_seconds = parse_retry_after(retry_after)
+            self.retry_after_until = max(self.retry_after_until, asyncio.get_running_loop().time() + wait_in_seconds)
+            logger.warning(f"{self.source} returned {status} for '{url}'. Pausing for {wait_in_seconds} seconds...")
+
+
+    async def _async_wait_for_crawl_delay(self, delay: float) -> None:
+        """
+        Wait until at least `delay` seconds have passed since the last fetch to this site started.
+        NOTE The start time is reserved before sleeping, so concurrent fetches line up one delay apart,
+        and a fetch doesn't wait at all if the last one was long enough ago.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start_time = max(now, self.next_fetch_time)
+        self.next_fetch_time = start_time + delay
+        if start_time > now:
+            await asyncio.sleep(start_time - now)
+
+
+    async def _async_wait_for_retry_after(self) -> None:
+        """
+        Wait until the site's Retry-After has passed, if it gave us one.
+        """
+        loop = asyncio.get_running_loop()
+        while (wait_in_seconds := self.retry_after_until - loop.time()) > 0:
+            await asyncio.sleep(wait_in_seconds)
+
+
+    def _is_third_party(self, hostname: str) -> bool:
+        """
+        Check if a hostname is outside the site's domain.
+        """
+        return hostname != self.site_domain and not hostname.endswith("." + self.site_domain)
+
+
+    async def _async_block_resources(self, route: AsyncPlaywrightRoute) -> None:
+        """
+        Abort every request except documents, scripts, and XHR, as well as trackers and third-party frames.
+        We only need the page's links.
+        NOTE Third-party scripts and XHR are let through, since the sites load their apps from CDNs.
+        """
+        request = route.request
+        hostname = urlparse(request.url).hostname or ""
+        if (request.resource_type not in ALLOWED_RESOURCE_TYPES
+            or any(blocked in hostname for blocked in BLOCKED_HOST_SUBSTRINGS)
+            or (request.resource_type == "document" and request.frame.parent_frame is not None and self._is_third_party(hostname))
+            ):
+            await route.abort()
+        else:
+            await route.continue_()
 
 
     async def _async_close_browser(self) -> None:
         """
-        Close browser instance and reset internal attributes
+        Close the browser contexts, close the browser if this scraper launched it, and reset internal attributes
         """
-        if self.browser:
+        for context in self.contexts:
+            await context.close()
+        self.contexts = []
+        self.page_pool = None
+        if self.browser and self.owns_browser:
             await self.browser.close()
-            self.browser = None
+        self.browser = None
 
 
     @classmethod
-    async def async_start(cls, pw_instance, robots_txt_url, user_agent, **launch_kwargs) -> 'PlaywrightAsyncScraper':
+    async def async_start(cls, pw_instance, robots_txt_url, user_agent, browser=None, session=None, **launch_kwargs) -> 'PlaywrightAsyncScraper':
         """
         Factory method for asynchronously starting the class.
+        NOTE Pass in a shared browser to only open a new context in it, rather than launching another Chromium.
         """
-        instance = cls(pw_instance, robots_txt_url, user_agent=user_agent, **launch_kwargs)
+        instance = cls(pw_instance, robots_txt_url, user_agent=user_agent, browser=browser, session=session, **launch_kwargs)
+        await instance._async_open_session()
         await instance._async_load_browser()
         await instance.async_get_robot_rules(instance.robots_txt_url)
         return instance
 
 
+    async def _async_open_session(self) -> None:
+        """
+        Open an HTTP session for this scraper if one wasn't passed in.
+        """
+        if self.owns_session and self.session is None:
+            self.session = aiohttp.ClientSession()
+
+
+    async def _async_close_session(self) -> None:
+        """
+        Close the HTTP session if this scraper opened it.
+        """
+        if self.session and self.owns_session:
+            await self.session.close()
+            self.session = None
+
+
     async def async_close(self) -> None:
         await self._async_close_browser()
+        await self._async_close_session()
 
 
     async def __aenter__(self) -> 'PlaywrightAsyncScraper':
+        await self._async_open_session()
         await self._async_load_browser()
         await self.async_get_robot_rules(self.robots_txt_url)
         return self
@@ -127,21 +305,38 @@ class PlaywrightAsyncScraper:
 
 
     #### START PAGE PROCESSING METHODS ####
-    async def _async_make_page(self) -> tuple[AsyncPlaywrightPage, AsyncPlaywrightBrowserContext]:
+    async def _async_make_page(self, context: AsyncPlaywrightBrowserContext) -> AsyncPlaywrightPage:
         """
-        Make an AsyncPlaywrightPage within a browser context.
+        Make an AsyncPlaywrightPage within one of the scraper's browser contexts.
         """
-        context = await self.browser.new_context()
-        page = await context.new_page()
-        return page, context
+        return await context.new_page()
+
+
+    async def _async_reset_page(self, page: AsyncPlaywrightPage) -> AsyncPlaywrightPage:
+        """
+        Get a used page ready for the next URL by sending it to a blank page.
+        If that fails (e.g. the page crashed), close it and return a new page from the same context instead.
+        """
+        try:
+            await page.goto("about:blank")
+            return page
+        except Exception as e:
+            logger.debug(f"Could not reset page, replacing it: {e}")
+            context = page.context
+            try:
+                await page.close()
+            except Exception:
+                pass
+            return await self._async_make_page(context)
 
 
     async def _async_open_page(self, url: str, page: AsyncPlaywrightPage) -> AsyncPlaywrightPage:
         """
-        Open a specified webpage and wait for any dynamic elements to load.
+        Open a specified webpage and wait for the links we want to load.
+        NOTE We wait for the target links rather than networkidle, since some sites never stop polling.
         """
-        await page.goto(url)
-        await page.wait_for_load_state("networkidle") # NOTE Defaults to 30 seconds wait time.
+        await page.goto(url, wait_until="domcontentloaded")
+        await page.wait_for_selector(self.target_selector, state="attached", timeout=READY_SELECTOR_TIMEOUT_IN_MS)
         return page
 
 
@@ -161,24 +356,65 @@ class PlaywrightAsyncScraper:
           }
         ]
         """
-        page, context = await self._async_make_page()
         # Default return is an emtpy dictionary
         url_dict_list = [{"href":None, "text": None}]
-        try:
-            page = await self._async_open_page(url, page)
-            url_dict_list = await async_extract_urls_using_javascript(page, self.source)
-        except AsyncPlaywrightTimeoutError as e:
-            logger.info(f"url '{url}' timed out. Returning empty dict list...")
-            logger.debug(e)
-        except Exception as e:
-            logger.info(f"url '{url}' caused an unexpected exception: {e} ")
-            traceback.print_exc()
-        finally:
-            await page.close()
-            await context.close()
+        async with PAGE_SEMAPHORE:
+            # Borrow a page from the pool. It's reset and put back afterwards, rather than closed.
+            page = await self.page_pool.get()
+            try:
+                page = await self._async_open_page(url, page)
+                url_dict_list = await async_extract_urls_using_javascript(page, self.source)
+            except AsyncPlaywrightTimeoutError as e:
+                logger.info(f"url '{url}' timed out. Returning empty dict list...")
+                logger.debug(e)
+            except Exception as e:
+                logger.info(f"url '{url}' caused an unexpected exception: {e} ")
+                traceback.print_exc()
+            finally:
+                self.page_pool.put_nowait(await self._async_reset_page(page))
         return url_dict_list
 
 
+    async def _async_try_http_extract(self, url: str) -> list[dict[str,str]] | None:
+        """
+        Try to get a page's links from its raw HTML with a plain GET, rather than opening it in the browser.
+        Returns None if the browser is needed, either because the site renders its links with JavaScript or because the GET failed.
+        NOTE The first page that's read decides it for the whole site. If it has no links in its HTML,
+        or it can't be read at all, every URL after it goes straight to the browser, so we don't GET every page twice.
+        """
+        if self.links_in_html is False:
+            return None
+        try:
+            async with self.session.get(url, timeout=HTTP_EXTRACT_TIMEOUT) as response:
+                if response.status != 200:
+                    self._pause_if_rate_limited(response.status, response.headers.get("retry-after"), url)
+                    return self._http_extract_failed(url, f"returned {response.status}")
+                html = await response.read()
+                page_url = str(response.url)
+            url_dict_list = extract_urls_from_html(html, page_url, self.target_class)
+        except (aiohttp.ClientError, asyncio.TimeoutError, LxmlParserError, ValueError) as e:
+            return self._http_extract_failed(url, f"failed: {e}")
+
+        if self.links_in_html is None:
+            self.links_in_html = bool(url_dict_list)
+            logger.info(f"{self.source} {'serves' if url_dict_list else 'does not serve'} its links in its HTML. "
+                        f"{'Skipping' if url_dict_list else 'Using'} the browser...")
+        return url_dict_list or None
+
+
+    def _http_extract_failed(self, url: str, reason: str) -> None:
+        """
+        Log a failed plain GET, and if it was the site's first, send the rest of the site's URLs to the browser.
+        Returns None, so the failed URL falls back to the browser too.
+        """
+        if self.links_in_html is None:
+            self.links_in_html = False
+            logger.info(f"GET '{url}' {reason}. Using the browser for the rest of {self.source}...")
+        else:
+            logger.debug(f"GET '{url}' {reason}. Falling back to the browser...")
+        return None
+
+
     async def _async_respectful_fetch(self, url: str) -> list[dict[str,str]] | list[dict[Never]]:
         """
         Limit scraping a URL based on a semaphore and the delay specified in robots.txt
@@ -190,51 +426,84 @@ class PlaywrightAsyncScraper:
                 logger.warning(f"Cannot scrape URL '{url}' as it's disallowed in robots.txt")
                 return [{"href":None, "text": None}]
             else: # Scrape the URL with the specified delay
-                await asyncio.sleep(delay)
+                await self._async_wait_for_crawl_delay(delay)
+                # NOTE This is inside the semaphore, so a rate-limited site holds all of its workers until the wait is over.
+                await self._async_wait_for_retry_after()
+                url_dict_list = await self._async_try_http_extract(url)
+                if url_dict_list is not None:
+                    return url_dict_list
                 return await self._async_fetch_urls_from_page(url)
 
 
     async def async_scrape(self, url: str) -> list[dict[str,str]] | None:
         """
         Scrape a URL asynchronously. Essentially a wrapper for _async_respectful_fetch.
+        NOTE Results are cached per URL as tasks, so concurrent or repeated calls for the same URL
+        await the same fetch instead of opening the page again. Failed fetches and the empty placeholder
+        (e.g. a timeout or a URL disallowed by robots.txt) aren't kept, so they can be retried.
         """
-        return await self._async_respectful_fetch(url)
+        task = self.scrape_tasks.get(url)
+        if task is None:
+            if len(self.scrape_tasks) >= SCRAPE_CACHE_SIZE:
+                self.scrape_tasks.pop(next(iter(self.scrape_tasks))) # Drop the oldest URL.
+            task = asyncio.ensure_future(self._async_respectful_fetch(url))
+            self.scrape_tasks[url] = task
 
+        try:
+            result = await task
+        except Exception:
+            if self.scrape_tasks.get(url) is task:
+                del self.scrape_tasks[url]
+            raise
+        if result == [{"href":None, "text": None}] and self.scrape_tasks.get(url) is task:
+            del self.scrape_tasks[url]
+        return result
 
-    def _build_url(self, state_code: str) -> str:
+
+    def _build_urls(self, state_codes: pd.Series) -> pd.Series:
         """
-        Implicit abstract method for building website specific URLs.
+        Implicit abstract method for building website specific URLs from a Series of state codes.
         """
         pass
 
 
-    def check_url_length(self, scrape_url: str):
+    def check_url_lengths(self, scrape_urls: pd.Series) -> pd.Series:
         """
-        Type check the length of scrape url for _build_url.
+        Type check the length of every scrape url from _build_urls in one pass.
         """
-        if len(scrape_url) == self.scrape_url_length:
-            logger.warning(f"scrape_url is not {self.scrape_url_length} characters, but {len(scrape_url)}")
-            logger.debug(f"url : {scrape_url}")
-            traceback.print_exc()
-            raise ValueError(f"scrape_url is not {self.scrape_url_length} characters, but {len(scrape_url)}")
+        wrong_length = scrape_urls.str.len() != self.scrape_url_length
+        if wrong_length.any():
+            logger.warning(f"{wrong_length.sum()} scrape_urls are not {self.scrape_url_length} characters")
+            logger.debug(f"urls : {scrape_urls[wrong_length].tolist()}")
+            raise ValueError(f"scrape_urls are not {self.scrape_url_length} characters, e.g. '{scrape_urls[wrong_length].iloc[0]}'")
         else:
-            logger.debug(f"{self.source} scrape_url built successfully.")
-            return scrape_url
+            logger.debug(f"{self.source} scrape_urls built successfully.")
+            return scrape_urls
+
+
+    def _make_url_map(self, state_codes: list[str]) -> dict[str, str]:
+        """
+        Build and length-check the URLs for a list of state codes with one vectorized string operation.
+        """
+        state_codes = pd.Series(state_codes, name="state_code", dtype=str)
+        state_urls = self.check_url_lengths(self._build_urls(state_codes))
+        return dict(zip(state_codes.tolist(), state_urls.tolist()))
 
 
-    def build_urls(self, locations_df: pd.DataFrame) -> list[dict[str,str]]:
+    def build_urls(self, state_codes: list[str]) -> list[dict[str,str]]:
         """
-        Create scrape URLs from the locations dataframe.
+        Create scrape URLs from the state codes in the locations table.
         """
-        # Drop duplicate states.
-        state_codes_df = locations_df.drop_duplicates(subset=['state_code'])
+        # Look up the URLs built in __init__. Only codes outside of US_STATE_CODES have to be built here.
+        missing_codes = [state_code for state_code in state_codes if state_code not in self.url_map]
+        if missing_codes:
+            self.url_map.update(self._make_url_map(missing_codes))
 
-        #Iterate through the states and build URLs out of them.
         state_url_dict_list = [
-            {"state_code": row.state_code, "state_url": self._build_url(row.state_code)}
-            for row in state_codes_df.itertuples()
+            {"state_code": state_code, "state_url": self.url_map[state_code]}
+            for state_code in state_codes
         ]
-        logger.info("Created state_code URLs for General Code",f=True)
+        logger.info(f"Created state_code URLs for {self.source}",f=True)
         return state_url_dict_list
 
 
@@ -297,45 +566,52 @@ class PlaywrightAsyncScraper:
         return unprocessed_urls
 
 
-    async def scrape(self, locations_df: pd.DataFrame, urls: list[dict[str,str]], db: MySqlDatabase) -> pd.DataFrame:
+    async def scrape(self, urls: list[dict[str,str]], db: MySqlDatabase) -> pd.DataFrame:
         """
         Scrape URLs and add it to a dataframe.
+        NOTE This doesn't need the locations table. The links are matched to locations afterwards by state_code and text
+        (see match_urls_to_locations), so scraping can start before the locations have been read.
         Args:
-            locations_df: A Dataframe of data from the table 'locations' in the database.
             urls: a list of URLs to scrape.
             db: a MySQL database instance
         Returns:
             A dataframe
         Examples:
         >>> # Example Return
-        >>>     state_code                           state_url                                       href               text
-        >>> 0         "AK"  "https://library.municode.com/ak/"  "https://library.municode.com/ak/ashvile"  "City of Ashvile"
-        >>> 1         "AL"  "https://library.municode.com/al/"  "https://library.municode.com/al/johnson"          "Johnson"
-        >>> 2         "AR"  "https://library.municode.com/ar/"  "https://library.municode.com/ar/vikberg"   "Vikberg County"
+        >>>     state_code                           state_url                                       href               text    source
+        >>> 0         "AK"  "https://library.municode.com/ak/"  "https://library.municode.com/ak/ashvile"  "City of Ashvile"  "municode"
+        >>> 1         "AL"  "https://library.municode.com/al/"  "https://library.municode.com/al/johnson"          "Johnson"  "municode"
+        >>> 2         "AR"  "https://library.municode.com/ar/"  "https://library.municode.com/ar/vikberg"   "Vikberg County"  "municode"
         """
-        results_url_dict_list = []
         unprocessed_urls = await self._filter_urls(urls, db)
 
-        # Scrape the URL and return its URLs and text.
+        # Scrape the URLs and return their URLs and text.
+        # NOTE The states are scraped concurrently. The number of pages open at once is capped by self.semaphore,
+        # and each fetch still waits for the delay in robots.txt (see _async_respectful_fetch).
         logger.info(f"Getting URLs from {self.source}...")
-        # Create generator that creates a list of dictionaries for each item return of async_scrape.
-        dict_generator: AsyncGenerator = (
-            {
-                'state_code': url['state_code'],
-                'state_url': url['state_url'],
-                'result': result # NOTE We don't unpack the dictionary since json_normalize will do that for us.
-            } for url in unprocessed_urls for result in await self.async_scrape(url['state_code'])
+
+        async def _scrape_one(url: dict[str,str]) -> tuple[dict[str,str], list[dict[str,str]]]:
+            return url, await self.async_scrape(url['state_url'])
+
+        # Create a list of dictionaries for each item return of async_scrape.
+        # NOTE Each state's results are saved as soon as it finishes, rather than after every state is done.
+        results_url_dict_list = []
+        for finished in asyncio.as_completed([_scrape_one(url) for url in unprocessed_urls]):
+            url, results = await finished
+            results_url_dict_list.extend( # Normalize the dictionaries, save them as CSVs, and append them to results_url_dict_list
+                self._save_output_df_to_csv({
+                    'state_code': url['state_code'],
+                    'state_url': url['state_url'],
+                    'result': result # NOTE We don't unpack the dictionary since json_normalize will do that for us.
+                }) for result in results
+            ) # -> list[dict]
+
+        # NOTE The links aren't merged with the locations here. Merging on state_code made a row for every location
+        # and link in a state, only for all but one row per link to be dropped as duplicates right after.
+        site_df = pd.DataFrame.from_records(
+            [{"state_code": dic["state_code"], "state_url": dic["state_url"], **dic["result"]} for dic in results_url_dict_list],
+            columns=["state_code", "state_url", "href", "text"]
         )
-        results_url_dict_list = [ # Normalize the dictionaries, save them as CSVs, and append them to results_url_dict_list
-            self._save_output_df_to_csv(dic) async for dic in dict_generator
-        ] # -> list[dict]
-
-        # Merge the created URLs with locations dataframe.
-            # NOTE Merge works instead of join because merge works on strings instead of indexes.
-            # See: https://stackoverflow.com/questions/50649853/trying-to-merge-2-dataframes-but-get-valueerror
-        output_df = pd.DataFrame.from_dict(results_url_dict_list)
-        logger.debug(f"output_df\n{output_df}",f=True)
-        site_df = locations_df.merge(results_url_dict_list, on="state_code", how="inner")
         logger.debug(f"site_df\n{site_df}",f=True)
 
         # Get rid of duplicate URLs
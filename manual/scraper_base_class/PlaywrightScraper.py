@@ -102,7 +102,7 @@ class Scraper(ABC):
         """
         robots_txt = fetch_robots_txt(self.robot_txt_url)
         rules = parse_robots_txt(robots_txt)
-        self.robot_rules = rules
+        self.robot_rules = rules.get(self.current_agent.lower()) or rules.get('*', {})
 
 
     def _open_webpage(self, url: str, page: PlaywrightPage) -> None:
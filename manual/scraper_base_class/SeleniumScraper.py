@@ -60,7 +60,7 @@ class SeleniumScraper:
     def get_robot_rules(self, robots_txt_url) -> None:
         robots_txt = fetch_robots_txt(robots_txt_url)
         rules: dict[str,dict[str|Any]] = parse_robots_txt(robots_txt)
-        self.robot_rules = rules
+        self.robot_rules = rules.get(self.user_agent.lower()) or rules.get('*', {})
 
     def _load_driver(self) -> None:
         chrome_options = Options()
@@ -123,26 +123,28 @@ class SeleniumScraper:
     def scrape(self, url: str) -> list[dict[str,str]] | None:
         return self._respectful_fetch(url)
 
-    def _build_url(self, state_code: str) -> str:
+    def _build_urls(self, state_codes: pd.Series) -> pd.Series:
         pass
 
-    def check_url_length(self, scrape_url: str):
-        if len(scrape_url) == self.scrape_url_length:
-            logger.warning(f"scrape_url is not {self.scrape_url_length} characters, but {len(scrape_url)}")
-            logger.debug(f"url : {scrape_url}")
-            traceback.print_exc()
-            raise ValueError(f"scrape_url is not {self.scrape_url_length} characters, but {len(scrape_url)}")
+    def check_url_lengths(self, scrape_urls: pd.Series) -> pd.Series:
+        wrong_length = scrape_urls.str.len() != self.scrape_url_length
+        if wrong_length.any():
+            logger.warning(f"{wrong_length.sum()} scrape_urls are not {self.scrape_url_length} characters")
+            logger.debug(f"urls : {scrape_urls[wrong_length].tolist()}")
+            raise ValueError(f"scrape_urls are not {self.scrape_url_length} characters, e.g. '{scrape_urls[wrong_length].iloc[0]}'")
         else:
-            logger.debug(f"{self.source} scrape_url built successfully.")
-            return scrape_url
+            logger.debug(f"{self.source} scrape_urls built successfully.")
+            return scrape_urls
 
     def build_urls(self, locations_df: pd.DataFrame) -> list[dict[str,str]]:
-        state_codes_df = locations_df.drop_duplicates(subset=['state_code'])
+        # NOTE Every state's URL is built with one vectorized string operation, rather than one call per state.
+        state_codes = pd.Series(locations_df['state_code'].unique(), name="state_code", dtype=str)
+        state_urls = self.check_url_lengths(self._build_urls(state_codes))
         state_url_dict_list = [
-            {"state_code": row.state_code, "state_url": self._build_url(row.state_code)}
-            for row in state_codes_df.itertuples()
+            {"state_code": state_code, "state_url": state_url}
+            for state_code, state_url in zip(state_codes.tolist(), state_urls.tolist())
         ]
-        logger.info("Created state_code URLs for General Code",f=True)
+        logger.info(f"Created state_code URLs for {self.source}",f=True)
         return state_url_dict_list
 
     def _save_output_df_to_csv(self, dic: dict) -> dict:
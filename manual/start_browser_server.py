@@ -0,0 +1,52 @@
+"""
+Keep one Chromium running between runs of scrape_legal_websites.py, so each run doesn't pay for starting a new one.
+
+Run this in the background, then set PLAYWRIGHT.CDP_ENDPOINT in config.yaml to the endpoint it logs
+(e.g. http://localhost:9222). scrape_legal_websites.py will connect to it with connect_over_cdp instead of launching a browser.
+The browser uses a persistent profile in BROWSER_USER_DATA_DIR, so its disk and DNS caches are kept between runs too.
+"""
+import asyncio
+import os
+import sys
+
+from playwright.async_api import async_playwright
+
+insert_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if insert_path not in sys.path:
+    sys.path.insert(0,insert_path)
+
+from config.config import HEADLESS, CDP_PORT, BROWSER_USER_DATA_DIR
+
+from logger.logger import Logger
+logger = Logger(logger_name=__name__)
+
+
+async def start_browser_server(port: int=CDP_PORT, user_data_dir: str=BROWSER_USER_DATA_DIR, headless: bool=HEADLESS) -> None:
+    """
+    Launch Chromium with a persistent profile and its CDP port open, then keep it running until the program is stopped.
+
+    Args:
+        port (int, optional): The port to serve the Chrome DevTools Protocol on. Defaults to CDP_PORT.
+        user_data_dir (str, optional): Where to keep the browser's profile. Defaults to BROWSER_USER_DATA_DIR.
+        headless (bool, optional): Whether to run the browser in headless mode. Defaults to HEADLESS.
+    """
+    async with async_playwright() as pw_instance:
+        context = await pw_instance.chromium.launch_persistent_context(
+            user_data_dir,
+            headless=headless,
+            args=[f"--remote-debugging-port={port}"]
+        )
+        logger.info(f"Chromium is running. Set PLAYWRIGHT.CDP_ENDPOINT to http://localhost:{port} to use it.")
+        try:
+            await asyncio.Event().wait() # NOTE Wait forever. The browser closes when the program is stopped.
+        finally:
+            await context.close()
+
+
+if __name__ == "__main__":
+    base_name = os.path.basename(__file__)
+    program_name = base_name if base_name != "main.py" else os.path.dirname(__file__)
+    try:
+        asyncio.run(start_browser_server())
+    except KeyboardInterrupt:
+        print(f"{program_name} program stopped.")
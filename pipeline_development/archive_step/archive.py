@@ -161,7 +161,7 @@ class SaveToInternetArchive:
                 logger.error(f"Error output: {e.stderr}")
             finally:
                 logger.info(f"Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
 
             # If it returns results, save them to result_list. Else, save it to no_result_list
             result_list.append(result_dict) if len(result) > 0 else no_result_list.append(result_dict)
@@ -360,7 +360,7 @@ async def main():
         urls = urls_to_process
         total_urls = len(urls)
         logger.info(f"{total_urls} URLs loaded. Starting waybackup.py...")
-        time.sleep(5)
+        await asyncio.sleep(5)
 
         for i, url in enumerate(urls):
 
@@ -375,12 +375,12 @@ async def main():
                 logger.info(f"Completed: {url}")
                 counter += 1
                 logger.info(f"Waiting {WAIT_TIME} seconds...")
-                time.sleep(WAIT_TIME)
+                await asyncio.sleep(WAIT_TIME)
             except subprocess.CalledProcessError as e:
                 logger.error(f"Error occurred while processing {url}: {e}")
                 logger.error(f"Error output: {e.stderr}")
                 logger.info(f"Waiting {WAIT_TIME} seconds...")
-                time.sleep(WAIT_TIME)
+                await asyncio.sleep(WAIT_TIME)
 
         logger.info(f"Done! {counter} out of {total_urls} URLS were parsed successfully.")
 
@@ -13,13 +13,6 @@ from requests import (
 import aiohttp
 
 import pandas as pd
-from playwright.sync_api import (
-    Playwright,
-    Browser as PlaywrightBrowser,
-    Page as PlaywrightPage,
-    TimeoutError as PlaywrightTimeoutError,
-)
-from playwright.async_api import Browser as AsyncPlaywrightBrowser
 from selenium import webdriver
 
 from abc import ABC, abstractmethod
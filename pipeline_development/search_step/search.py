@@ -242,7 +242,7 @@ class SearchEngine:
                     logger.debug(f"self.url_hash_set:\n{self.url_hash_set}")
                     if log_level == 10:
                         logger.debug("LET'S FUCKING GOOOOOOO!!!!")
-                        time.sleep(1)
+                        await asyncio.sleep(1)
 
                     # Perform the search
                     # NOTE We don't paginate results as the search classes will never go beyond the first page of results.
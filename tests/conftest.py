@@ -0,0 +1,7 @@
+import os
+import sys
+
+# NOTE The modules import each other from the repo root (e.g. 'from config.config import ...'), so it has to be on the path.
+insert_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if insert_path not in sys.path:
+    sys.path.insert(0,insert_path)
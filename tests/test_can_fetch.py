@@ -0,0 +1,89 @@
+import random
+import re
+
+import pytest
+
+from utils.manual.scrape_legal_websites_utils.can_fetch import can_fetch, _can_fetch_path, _rule_to_regex
+
+
+def _rules(allow=(), disallow=(), crawl_delay=0) -> dict:
+    return {'allow': tuple(allow), 'disallow': tuple(disallow), 'crawl_delay': crawl_delay}
+
+
+@pytest.mark.parametrize("url, rules, expected", [
+    # No rules means everything is allowed.
+    ("https://example.com/anything", _rules(), True),
+    # The longest matching rule wins, whichever kind it is.
+    ("https://example.com/a/b/c", _rules(allow=["/a/b"], disallow=["/a"]), True),
+    ("https://example.com/a/x", _rules(allow=["/a/b"], disallow=["/a"]), False),
+    ("https://example.com/a/b/c", _rules(allow=["/a"], disallow=["/a/b"]), False),
+    # Allow wins when the matching rules are the same length.
+    ("https://example.com/page", _rules(allow=["/page"], disallow=["/page"]), True),
+    # A longer rule that doesn't match doesn't stop a shorter one from matching.
+    ("https://example.com/abx", _rules(allow=["/abcdefg"], disallow=["/ab"]), False),
+    # An empty path is checked as '/'.
+    ("https://example.com", _rules(disallow=["/"]), False),
+])
+def test_can_fetch_uses_longest_match(url, rules, expected):
+    assert can_fetch(url, rules)[0] is expected
+
+
+@pytest.mark.parametrize("url, rules, expected", [
+    # '*' matches anything, and '$' anchors the rule to the end of the path.
+    ("https://example.com/docs/file.pdf", _rules(disallow=["/*.pdf$"]), False),
+    ("https://example.com/docs/file.pdf?download=1", _rules(disallow=["/*.pdf$"]), True),
+    ("https://example.com/docs/file.pdfx", _rules(disallow=["/*.pdf$"]), True),
+    ("https://example.com/exact", _rules(disallow=["/exact$"]), False),
+    ("https://example.com/exactly", _rules(disallow=["/exact$"]), True),
+    # Rules can match on the query string.
+    ("https://example.com/list?page=2", _rules(disallow=["/*?page="]), False),
+    ("https://example.com/list", _rules(disallow=["/*?page="]), True),
+    # A wildcard rule is compared by its length, like a literal one.
+    ("https://example.com/a/private", _rules(allow=["/a"], disallow=["/*/private"]), False),
+    ("https://example.com/a/private/ok", _rules(allow=["/a/private/ok"], disallow=["/*/private"]), True),
+    # Allow wins a tie between a wildcard rule and a literal rule.
+    ("https://example.com/abc", _rules(allow=["/abc"], disallow=["/a*c"]), True),
+    ("https://example.com/abc", _rules(allow=["/a*c"], disallow=["/abc"]), True),
+])
+def test_can_fetch_handles_wildcards_and_end_anchors(url, rules, expected):
+    assert can_fetch(url, rules)[0] is expected
+
+
+def test_can_fetch_returns_crawl_delay():
+    assert can_fetch("https://example.com/", _rules(crawl_delay=2.5)) == (True, 2.5)
+    assert can_fetch("https://example.com/", {}) == (True, 0)
+
+
+def test_rule_to_regex_escapes_everything_but_wildcards():
+    assert _rule_to_regex("/a.b*c$") == r"/a\.b.*c$"
+    assert _rule_to_regex("/a?b") == r"/a\?b"
+
+
+def _reference_can_fetch(path: str, allow: tuple[str, ...], disallow: tuple[str, ...]) -> bool:
+    """
+    Check every rule without sorting or stopping early. The longest match wins, and Allow wins ties.
+    """
+    matches = [
+        (len(rule), is_allow)
+        for is_allow, rules in ((True, allow), (False, disallow))
+        for rule in rules
+        if re.match(_rule_to_regex(rule), path)
+    ]
+    return max(matches)[1] if matches else True
+
+
+def test_can_fetch_path_matches_checking_every_rule():
+    # NOTE _can_fetch_path stops at the first literal rule that can't beat the best match so far,
+    # so compare it to checking every rule, over many small random rule sets.
+    rng = random.Random(0)
+    pieces = ["/", "a", "b", "*", "$"]
+
+    def _random_rule() -> str:
+        rule = "/" + "".join(rng.choice(pieces[:4]) for _ in range(rng.randint(0, 4)))
+        return rule + "$" if rng.random() < 0.2 else rule
+
+    for _ in range(2000):
+        allow = tuple(_random_rule() for _ in range(rng.randint(0, 3)))
+        disallow = tuple(_random_rule() for _ in range(rng.randint(0, 3)))
+        path = "/" + "".join(rng.choice("/ab") for _ in range(rng.randint(0, 5)))
+        assert _can_fetch_path(path, allow, disallow) == _reference_can_fetch(path, allow, disallow), (path, allow, disallow)
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+# NOTE database.database needs the MySQL drivers and pandas at import time, so these tests only run where they're installed.
+pytest.importorskip("pandas")
+pytest.importorskip("aiomysql")
+pytest.importorskip("mysql.connector")
+
+import pandas as pd
+
+from database.database import _LOAD_DATA_NULL, _split_rows_into_batches, _to_load_data_value, _write_load_data_csv
+
+
+@pytest.mark.parametrize("value", [None, float("nan"), pd.NA, pd.NaT])
+def test_to_load_data_value_turns_missing_values_into_null(value):
+    # NOTE These would otherwise be written as strings like 'nan', which MySQL loads as 0 or rejects.
+    assert _to_load_data_value(value) is _LOAD_DATA_NULL
+
+
+def test_to_load_data_value_writes_bools_as_ints():
+    assert _to_load_data_value(True) == 1 and type(_to_load_data_value(True)) is int
+    assert _to_load_data_value(False) == 0 and type(_to_load_data_value(False)) is int
+
+
+@pytest.mark.parametrize("value", ["Coker", "", 0, 2.5])
+def test_to_load_data_value_leaves_other_values_alone(value):
+    assert _to_load_data_value(value) is value
+
+
+def test_split_rows_into_batches_caps_rows_per_batch():
+    rows = [(i,) for i in range(7)]
+    assert _split_rows_into_batches(rows, batch_size=3) == [rows[0:3], rows[3:6], rows[6:7]]
+
+
+def test_split_rows_into_batches_starts_a_new_batch_before_max_bytes():
+    # NOTE Each row's size is estimated as its values' string lengths plus 4 bytes per value, so each row here is 14 bytes.
+    rows = [("x" * 10,) for _ in range(5)]
+    assert _split_rows_into_batches(rows, batch_size=100, max_bytes=30) == [rows[0:2], rows[2:4], rows[4:5]]
+
+
+def test_split_rows_into_batches_keeps_a_row_bigger_than_max_bytes_in_its_own_batch():
+    rows = [("small",), ("x" * 100,), ("small",)]
+    assert _split_rows_into_batches(rows, batch_size=100, max_bytes=20) == [[rows[0]], [rows[1]], [rows[2]]]
+
+
+def test_split_rows_into_batches_handles_no_rows():
+    assert _split_rows_into_batches([], batch_size=10) == []
+
+
+def _read_load_data_csv(input_list: list) -> str:
+    path = _write_load_data_csv(input_list)
+    try:
+        with open(path, encoding="utf-8", newline="") as file:
+            return file.read()
+    finally:
+        os.remove(path)
+
+
+def test_write_load_data_csv_writes_missing_values_as_bare_nulls():
+    # NOTE A quoted "NULL" would be loaded as the string 'NULL', and a bare nan as 0, so all of these have to be bare NULLs.
+    assert _read_load_data_csv([(None, float("nan"), pd.NA, pd.NaT)]) == "NULL,NULL,NULL,NULL\n"
+
+
+def test_write_load_data_csv_quotes_and_escapes_strings():
+    assert _read_load_data_csv([('a"b', "c\\d", "x,y")]) == '"a\\"b","c\\\\d","x,y"\n'
+
+
+def test_write_load_data_csv_leaves_numbers_bare():
+    assert _read_load_data_csv([(1, 2.5, True, False)]) == "1,2.5,1,0\n"
+
+
+def test_write_load_data_csv_reads_dict_rows_in_order():
+    assert _read_load_data_csv([{"gnis": 1, "place_name": "Coker"}, {"gnis": 2, "place_name": None}]) == '1,"Coker"\n2,NULL\n'
@@ -0,0 +1,70 @@
+import random
+import re
+
+import pytest
+
+# NOTE Matcher needs pandas and numpy at import time, so these tests only run where they're installed.
+pd = pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+
+from manual.link_urls_to_location_data.Matcher import Matcher
+
+
+def _state_places(texts: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({'text_href_lc': texts, 'href': [f"https://example.com/{i}" for i in range(len(texts))]})
+
+
+def test_make_word_index_maps_words_to_row_positions():
+    word_index = Matcher._make_word_index(_state_places(["town of coker", "coker county", "zinc"]))
+    assert word_index['coker'] == {0, 1}
+    assert word_index['zinc'] == {2}
+    assert 'haines' not in word_index
+
+
+def test_get_candidates_only_returns_rows_with_every_word():
+    state_places = _state_places(["city of saint george", "george town", "saint mary", "saint george's"])
+    word_index = Matcher._make_word_index(state_places)
+    candidates = Matcher._get_candidates("saint george", state_places, word_index)
+    assert candidates['text_href_lc'].tolist() == ["city of saint george", "saint george's"]
+
+
+def test_get_candidates_returns_nothing_when_a_word_is_missing():
+    state_places = _state_places(["city of saint george"])
+    word_index = Matcher._make_word_index(state_places)
+    assert Matcher._get_candidates("saint paul", state_places, word_index).empty
+
+
+def test_get_candidates_returns_every_row_for_names_without_words():
+    state_places = _state_places(["a", "b"])
+    word_index = Matcher._make_word_index(state_places)
+    assert len(Matcher._get_candidates("...", state_places, word_index)) == 2
+
+
+@pytest.mark.parametrize("place_name, text, expected", [
+    ("coker", "town of coker", True),
+    ("coker", "coker", True),
+    ("coker", "cokerville", False),
+    ("coker", "west-coker.", True),
+    # The first hit is inside a word, but a later one isn't.
+    ("ton", "tonton ton", True),
+    ("ton", "tonton_ton", False),
+    ("saint george", "city of saint george's", True),
+    ("são paulo", "city of são paulo", True),
+    ("paulo", "sãopaulo", False),
+    # Names that don't start and end with a word character go through the regex.
+    ("st. mary.", "st. mary. county", False),
+    ("(old) town", "the (old) town", False),
+])
+def test_is_place_in_text_matches_whole_words(place_name, text, expected):
+    assert Matcher._is_place_in_text(place_name, text) is expected
+
+
+def test_is_place_in_text_agrees_with_boundary_regex():
+    # NOTE The str.find fast path has to give the same answer as re.search(r'\bname\b', text), so compare them over random strings.
+    rng = random.Random(0)
+    alphabet = "ab _-.é"
+    for _ in range(5000):
+        place_name = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3)))
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+        expected = re.search(r'\b' + re.escape(place_name) + r'\b', text) is not None
+        assert Matcher._is_place_in_text(place_name, text) is expected, (place_name, text)
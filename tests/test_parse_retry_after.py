@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from utils.manual.scrape_legal_websites_utils.parse_retry_after import parse_retry_after, DEFAULT_RETRY_AFTER_IN_SECONDS
+
+
+@pytest.mark.parametrize("retry_after, expected", [
+    ("120", 120.0),
+    (" 30 ", 30.0),
+    ("0", 0.0),
+    (None, DEFAULT_RETRY_AFTER_IN_SECONDS),
+    ("", DEFAULT_RETRY_AFTER_IN_SECONDS),
+    ("not a date", DEFAULT_RETRY_AFTER_IN_SECONDS),
+    ("-5", DEFAULT_RETRY_AFTER_IN_SECONDS),
+])
+def test_parse_retry_after_reads_seconds(retry_after, expected):
+    assert parse_retry_after(retry_after) == expected
+
+
+def test_parse_retry_after_uses_the_given_default():
+    assert parse_retry_after(None, default=7.0) == 7.0
+
+
+def test_parse_retry_after_reads_http_dates():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    assert 100 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 120
+
+
+def test_parse_retry_after_never_returns_a_negative_wait():
+    retry_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0.0
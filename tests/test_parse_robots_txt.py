@@ -0,0 +1,46 @@
+from utils.manual.scrape_legal_websites_utils.parse_robots_txt import parse_robots_txt
+
+
+ROBOTS_TXT = """
+# A comment line.
+User-agent: *
+Disallow: /private/   # A trailing comment.
+Allow: /private/open/
+Disallow:
+Crawl-delay: 5
+
+User-agent: GoogleBot
+User-agent: bingbot
+Disallow: /search
+Crawl-delay: 2.5
+
+User-agent: slowbot
+Crawl-delay: soon
+"""
+
+
+def test_parse_robots_txt_groups_rules_by_agent():
+    rules = parse_robots_txt(ROBOTS_TXT)
+    assert rules['*'] == {'allow': ('/private/open/',), 'disallow': ('/private/',), 'crawl_delay': 5.0}
+
+
+def test_parse_robots_txt_shares_rules_between_consecutive_agents():
+    rules = parse_robots_txt(ROBOTS_TXT)
+    # NOTE Agent names are lowercased, so they can be looked up the same way however they're written.
+    assert rules['googlebot'] == {'allow': (), 'disallow': ('/search',), 'crawl_delay': 2.5}
+    assert rules['bingbot'] == rules['googlebot']
+
+
+def test_parse_robots_txt_ignores_bad_crawl_delays():
+    assert parse_robots_txt(ROBOTS_TXT)['slowbot']['crawl_delay'] == 0
+
+
+def test_parse_robots_txt_gives_rules_before_any_agent_to_current_agent():
+    rules = parse_robots_txt("Disallow: /tmp/\nUser-agent: other\nDisallow: /", current_agent="mybot")
+    assert rules['mybot']['disallow'] == ('/tmp/',)
+    assert rules['other']['disallow'] == ('/',)
+
+
+def test_parse_robots_txt_handles_empty_files():
+    assert parse_robots_txt("") == {'*': {'allow': (), 'disallow': (), 'crawl_delay': 0}}
+    assert parse_robots_txt(None) == {'*': {'allow': (), 'disallow': (), 'crawl_delay': 0}}
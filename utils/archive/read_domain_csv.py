@@ -1,24 +1,18 @@
-import csv
+import pandas as pd
 
-from . import read_domain_csv, reconstruct_domain_from_csv_filename
+from .reconstruct_domain_from_csv_filename import reconstruct_domain_from_csv_filename
 
 def read_domain_csv(file_path: str, skip_headers: bool=True) -> list[tuple]:
+    """
+    Read a waybackup CSV file into a list of tuples, with the file's domain appended to each row.
+    NOTE All values, including the timestamp in the second column, are read as strings.
+    """
     output = []
     try:
         domain = reconstruct_domain_from_csv_filename(file_path)
-        with open(file_path, mode='r', newline='') as csvfile:
-            reader = csv.reader(csvfile)
-
-            if skip_headers:
-                next(reader, None)
-
-            for row in reader:
-                if row:  # Ensure the row is not empty
-                    row = list(row)
-                    row[1] = read_domain_csv(row[1]) # Convert the timestamp to a string.
-                    row.append(domain)
-                    row = tuple(row)
-                    output.append(row)
+        df = pd.read_csv(file_path, header=0 if skip_headers else None, dtype=str, keep_default_na=False)
+        df['domain'] = domain
+        output = list(df.itertuples(index=False, name=None))
 
     except FileNotFoundError:
         print(f"Error: The file {file_path} does not exist.")
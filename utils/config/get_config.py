@@ -3,6 +3,8 @@ from typing import Any
 
 from .get_config_files import get_config_files
 
+_MISSING = object()
+
 def get_config(path:str, constant:str) -> Any | bool:
     """
     Get a key from a yaml file.
@@ -20,23 +22,16 @@ def get_config(path:str, constant:str) -> Any | bool:
         >>> config("SYSTEM", "NONEXISTENT_KEY") or 3
         3
     """
-    keys = path + "." + constant
-
     # Load private and public config.yaml files.
     data: dict = get_config_files()
 
     # Split the path into individual keys
-    keys = path.split('.') + [constant]
+    keys = tuple(path.split('.')) + (constant,)
 
     # Traverse the nested dictionary
-    try:
-        for key in keys:
-            if key in data:
-                data = data[key]
-            else:
-                print(f"Could not load config {constant}. Using default instead.")
-                return False
-        return data
-    except:
-        print(f"Could not load config {constant}. Using default instead.")
-        return False
\ No newline at end of file
+    for key in keys:
+        data = data.get(key, _MISSING) if isinstance(data, dict) else _MISSING
+        if data is _MISSING:
+            print(f"Could not load config {constant}. Using default instead.")
+            return False
+    return data
\ No newline at end of file
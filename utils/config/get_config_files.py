@@ -1,11 +1,14 @@
 
+import functools
 import os
 
 import yaml
 
+@functools.lru_cache(maxsize=1)
 def get_config_files() -> dict:
     """
     Load YAML configuration files and return their contents.
+    NOTE The result is cached, so the files are only read and parsed once per process.
     
     ### Returns
     - Dictionary with the loaded configuration data.
@@ -1,3 +1,5 @@
+import functools
+
 
 
 try:
@@ -13,6 +15,10 @@ except ImportError:
     def _check_if_pandas_df(args: tuple|dict|list[str]) -> tuple|dict|list[str]:
         return args
 
+@functools.lru_cache(maxsize=128)
+def _join_column_names(column_names: tuple[str, ...]) -> str:
+    return ", ".join(column_names)
+
 def get_column_names(args, return_str_list: bool=False) -> str|list[str]:
     """
     Conver interable container of some kind and convert it into a single string joined by ', '
@@ -39,10 +45,11 @@ def get_column_names(args, return_str_list: bool=False) -> str|list[str]:
 
     # Convert val_args based on their type.
     if isinstance(val_args, dict):
-        _args = val_args.keys()
+        _args = tuple(val_args.keys())
     elif isinstance(val_args, (list,tuple)):
-        _args = [str(arg) for arg in val_args] # Force convert each arg into a string if it isn't already.
+        _args = tuple(str(arg) for arg in val_args) # Force convert each arg into a string if it isn't already.
     else:
         raise ValueError(f"Unsupported type after validation: '{type(val_args)}'")
 
-    return ", ".join(_args) if not return_str_list else _args
+    # NOTE Joining is cached, since the same schemas tend to get passed in over and over again.
+    return _join_column_names(_args) if not return_str_list else list(_args)
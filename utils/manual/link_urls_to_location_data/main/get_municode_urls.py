@@ -1,6 +1,5 @@
 import asyncio
 import os
-import time
 
 
 from selenium.webdriver.common.by import By
@@ -44,7 +43,7 @@ async def get_municode_urls_from_state_landing_page(url: str,
     else:
         driver.refresh()
         logger.info(f"Waiting {wait_in_seconds} seconds per Municode's robots.txt")
-        time.sleep(wait_in_seconds)
+        await asyncio.sleep(wait_in_seconds)
 
     logger.info(f"Getting URL {url}...")
     driver.get(url)
@@ -1,4 +1,4 @@
-import time
+import asyncio
 
 
 from bs4 import BeautifulSoup
@@ -15,6 +15,17 @@ from logger.logger import Logger
 logger = Logger(logger_name=__name__)
 
 
+def _parse_links(content: bytes, class_: str, url: str) -> list[dict[str,str,str]]:
+    """
+    Parse a page's HTML and get the href and text of each element under the target class.
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    return [
+        {'url': url, 'href': link.get('href'), 'text': link.text.strip()} 
+        for link in soup.find_all(class_=class_)
+    ]
+
+
 async def get_urls(urls: str, source: str=None, driver: webdriver.Chrome=None) -> list[dict[str,str,str]]:
     wait_in_seconds = LEGAL_WEBSITE_DICT[source]['wait_in_seconds']
     class_ = LEGAL_WEBSITE_DICT[source]['target_class']
@@ -35,33 +46,19 @@ async def get_urls(urls: str, source: str=None, driver: webdriver.Chrome=None) -
             except WebDriverException as e:
                 logger.error(f"Selenium error retrieving {url}: {e}")
     else: # Default path using Beautiful Soup
+        # NOTE The fetch and the parse both block, so they're run in threads to keep the event loop free.
+        # A call only parses a state's worth of small pages (about 50), so a process pool isn't worth starting.
         for url in urls:
             logger.info(f"Getting URL {url} from {source}...")
             try:
-                response = requests.get(url, timeout=10)
+                response = await asyncio.to_thread(requests.get, url, timeout=10)
                 if response.status_code == 200:
                     logger.info(f"URL {url} OK. Parsing content...")
-                    # logger.debug(response.content)
-                    # time.sleep(5)
-
-                    # Parse the HTML content
-                    soup = BeautifulSoup(response.content, 'html.parser')
-
-                    # Find all elements within the class.
-                    links = soup.find_all(class_=class_)
-                    logger.info(f"Found {len(links)} links under class {class_}")
-                    
                     # Extract href and text from each link
-                    for link in links:
-                        href = link.get('href')
-                        text = link.text.strip()
-                        results.append({
-                            'url': url,
-                            'href': href,
-                            'text': text
-                        })
-
-                    time.sleep(wait_in_seconds)
+                    links = await asyncio.to_thread(_parse_links, response.content, class_, url)
+                    logger.info(f"Found {len(links)} links under class {class_}")
+                    results.extend(links)
+                    await asyncio.sleep(wait_in_seconds)
                 else:
                     logger.warning(f"Failed to retrieve {url}. Status code: {response.status_code}")
             except requests.RequestException as e:
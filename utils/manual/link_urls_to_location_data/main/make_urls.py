@@ -1,8 +1,18 @@
-from config.config import LEGAL_WEBSITE_DICT, US_STATE_CODES
+import functools
 
-def make_urls(source: str) -> list[str]:
+from config.config import LEGAL_WEBSITE_DICT, US_STATE_CODES, US_STATE_CODES_LOWER
+
+@functools.lru_cache(maxsize=None)
+def make_urls(source: str) -> tuple[str, ...]:
+    """
+    Make a landing page URL for each US state for a given source.
+    NOTE Since LEGAL_WEBSITE_DICT and US_STATE_CODES are constants, the result is cached per source.
+    Callers get the same tuple back on every call.
+
+    Examples:
+    >>> make_urls("municode")
+    ('https://library.municode.com/al', 'https://library.municode.com/ak', ...)
+    """
     url = LEGAL_WEBSITE_DICT[source]["base_url"]
-    return [
-        f"{url}{code if source == 'general_code' else code.lower()}" 
-        for code in US_STATE_CODES
-    ]
\ No newline at end of file
+    codes = US_STATE_CODES if source == 'general_code' else US_STATE_CODES_LOWER
+    return tuple(url + code for code in codes)
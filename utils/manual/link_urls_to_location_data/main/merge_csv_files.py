@@ -1,7 +1,8 @@
 import os 
 
+import pandas as pd
+
 from .make_csv_file_path_with_cwd import make_csv_file_path_with_cwd
-from ....shared.save_to_csv import save_to_csv
 from ....shared.load_from_csv import load_from_csv
 
 
@@ -11,16 +12,31 @@ logger = Logger(logger_name=__name__)
 
 
 def merge_csv_files(filename: str) -> None:
-    if not os.path.exists(make_csv_file_path_with_cwd(filename)):
-        result_list = []
-        for file in LEGAL_WEBSITE_DICT.keys():
-            path = make_csv_file_path_with_cwd(file)
-            logger.debug(f"path: {path}")
-            if os.path.exists(path):
-                logger.info(f"Got {file}")
-                result_list.extend(load_from_csv(path))
-        logger.debug(result_list)
-        save_to_csv(result_list, make_csv_file_path_with_cwd(filename))
-    else:
+    """
+    Merge each source's results CSV into a single '{filename}_results.csv' file.
+    NOTE This does nothing if the merged file already exists.
+    """
+    output_path = make_csv_file_path_with_cwd(filename)
+    if os.path.exists(output_path):
         logger.info(f"{filename}.csv already exists.")
-    return
\ No newline at end of file
+        return
+
+    frames = []
+    for file in LEGAL_WEBSITE_DICT.keys():
+        path = make_csv_file_path_with_cwd(file)
+        logger.debug(f"path: {path}")
+        if os.path.exists(path):
+            logger.info(f"Got {file}")
+            frames.append(load_from_csv(path, return_df=True))
+
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        logger.warning("No data to save.")
+        return
+
+    # Concatenate once at the end, rather than growing a list of rows file by file.
+    merged = pd.concat(frames, axis=0, ignore_index=True, copy=False)
+    logger.debug(merged)
+    merged.to_csv(output_path, index=False)
+    logger.info(f"Data saved to {output_path}")
+    return
@@ -55,31 +55,37 @@ def pivot_df_from_long_to_wide(output_df: pd.DataFrame) -> pd.DataFrame:
     }
     logger.debug(f"Created source_map: {source_map}")
 
-    # Initialize new columns with NaN values
-    for col in source_map.values():
-        df[col] = pd.NA
-    logger.debug(f"Initialized new columns. New columns: {source_map.values()}",f=True)
+    # Places that matched more than one source have lists in 'source' and 'href' (see Matcher.match).
+    # Give each (source, href) pair its own row, so each one fills in its own source column.
+    # NOTE The lists in a row are always the same length, so they can be exploded together.
+    df = df.explode(['source', 'href'], ignore_index=True)
 
     # Reformat american legal hrefs so that they link correctly.
     amlegal_pattern = r"regions/[a-z]{2}/"
-    def clean_amlegal_href(href):
-        if isinstance(href, str) and "amlegal" in href:
-            return re.sub(amlegal_pattern, '', href)
-        return href
-    df['href'] = df['href'].apply(clean_amlegal_href)
-
-    # Iterate through rows and populate the new columns
-    for idx, row in df.iterrows():
-        if pd.notna(row['source']) and pd.notna(row['href']):
-            source_col = source_map.get(row['source'])
-            if source_col:
-                df.at[idx, source_col] = row['href']
-    logger.debug(f"Populated new columns\nSample row\n{df.iloc[0].to_dict()}",f=True)
-    
-    # Drop the original 'href' and 'source' columns
-    df = df.drop(['href', 'source'], axis=1)
-    logger.debug(f"Dropped 'href' and 'source' columns.\nRemaining columns\n{df.columns.tolist()}",f=True)
-    
+    is_amlegal = df['href'].str.contains("amlegal", regex=False, na=False)
+    df.loc[is_amlegal, 'href'] = df.loc[is_amlegal, 'href'].str.replace(amlegal_pattern, '', regex=True)
+
+    # Only rows with a known source and an href can fill in a source column.
+    has_source = df['source'].isin(source_map.keys()) & df['href'].notna() & (df['href'] != '')
+    if not has_source.all():
+        logger.debug(f"Dropped {(~has_source).sum()} rows without a known source and an href.")
+    df = df.loc[has_source, ['gnis', 'place_name', 'state_code', 'source', 'href']]
+
+    # Pivot so that each place gets one row, with one column per source.
+    # NOTE The keys are categorical to make hashing them cheaper, and observed=True
+    # keeps pandas from building every combination of unused categories.
+    index_columns = ['gnis', 'place_name', 'state_code']
+    index_dtypes = df[index_columns].dtypes
+    for col in index_columns + ['source']:
+        df[col] = df[col].astype('category')
+    df = df.pivot_table(index=index_columns, columns='source', values='href', aggfunc='first', observed=True)
+    df.columns = df.columns.astype(str).map(source_map)
+    df.columns.name = None
+    df = df.reindex(columns=list(source_map.values())).reset_index()
+    for col in index_columns:
+        df[col] = df[col].astype(index_dtypes[col])
+    logger.debug(f"Pivoted sources into columns\nSample row\n{df.iloc[0].to_dict() if len(df) else None}",f=True)
+
     # Reorder columns to match the desired output
     column_order = ['gnis', 'place_name', 'state_code'] + list(source_map.values())
     df = df[column_order]
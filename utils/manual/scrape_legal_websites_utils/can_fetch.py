@@ -1,24 +1,69 @@
+import functools
 import re
+from typing import NamedTuple
 from urllib.parse import urlparse
 
 
-def can_fetch(url: str, robot_rules: dict) -> tuple[bool, int]:
+class _RobotRule(NamedTuple):
+    is_wildcard: bool
+    length: int
+    is_allow: bool
+    path: str
+    pattern: re.Pattern | None
+
+
+def _rule_to_regex(rule: str) -> str:
     """
-    Compare a URL to a robots.txt dictionary and see if we can scrape it.
-    Also return the website's delay
+    Turn a robots.txt path rule into a regex. '*' matches anything, and a '$' at the end anchors the rule to the end of the path.
     """
-    path = urlparse(url).path
-    delay = robot_rules.get('crawl-delay', 0)  # Default delay is 0 if not specified
+    end_anchor = rule.endswith('$')
+    regex = re.escape(rule.rstrip('$')).replace(r'\*', '.*')
+    return regex + '$' if end_anchor else regex
 
-    # Check if path matches any allow rule
-    for allow_path in robot_rules.get('allow', []):
-        if re.match(allow_path.replace('*', '.*'), path):
-            return True, delay
 
-    # Check if path matches any disallow rule
-    for disallow_path in robot_rules.get('disallow', []):
-        if re.match(disallow_path.replace('*', '.*'), path):
-            return False, delay
+@functools.lru_cache(maxsize=256)
+def _sort_rules(allow: tuple[str, ...], disallow: tuple[str, ...]) -> tuple[_RobotRule, ...]:
+    """
+    Merge the allow and disallow rules into one list, sorted the same way as CPython's robotparser (gh-149381):
+    wildcard rules first, then literal paths from longest to shortest, with Allow before Disallow when they're the same length.
+    NOTE This is cached on the rules themselves, so each site's rules are only sorted and compiled once.
+    """
+    rules = []
+    for is_allow, paths in ((True, allow), (False, disallow)):
+        for path in paths:
+            is_wildcard = '*' in path or path.endswith('$')
+            pattern = re.compile(_rule_to_regex(path)) if is_wildcard else None
+            rules.append(_RobotRule(is_wildcard, len(path), is_allow, path, pattern))
+    return tuple(sorted(rules, key=lambda rule: (rule.is_wildcard, rule.length, rule.is_allow), reverse=True))
 
-    # If no rules match, it's allowed by default
-    return True, delay
+
+@functools.lru_cache(maxsize=4096)
+def _can_fetch_path(path: str, allow: tuple[str, ...], disallow: tuple[str, ...]) -> bool:
+    """
+    Check a URL path against the allow and disallow rules. The longest matching rule wins, and Allow wins ties.
+    If no rules match, the path is allowed. The result is cached per path and set of rules.
+    """
+    best_length = -1
+    best_is_allow = True
+    for rule in _sort_rules(allow, disallow):
+        # NOTE Literal rules are sorted longest first, so once one can't beat the best match, none of the rest can either.
+        if not rule.is_wildcard and (rule.length < best_length or (rule.length == best_length and best_is_allow)):
+            break
+        matched = rule.pattern.match(path) if rule.is_wildcard else path.startswith(rule.path)
+        if matched and (rule.length > best_length or (rule.length == best_length and rule.is_allow)):
+            best_length = rule.length
+            best_is_allow = rule.is_allow
+    return best_is_allow
+
+
+def can_fetch(url: str, robot_rules: dict) -> tuple[bool, int]:
+    """
+    Compare a URL to a robots.txt dictionary and see if we can scrape it.
+    Also return the website's delay
+    """
+    parsed_url = urlparse(url)
+    path = parsed_url.path or '/'
+    if parsed_url.query: # Rules can match on the query string too.
+        path = f"{path}?{parsed_url.query}"
+    delay = robot_rules.get('crawl_delay', 0)  # Default delay is 0 if not specified
+    return _can_fetch_path(path, tuple(robot_rules.get('allow', ())), tuple(robot_rules.get('disallow', ()))), delay
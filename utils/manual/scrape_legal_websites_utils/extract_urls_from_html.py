@@ -0,0 +1,42 @@
+import functools
+
+import lxml.html
+
+
+@functools.lru_cache(maxsize=None)
+def _make_class_xpath(target_class: str) -> str:
+    """
+    Make an XPath that matches <a> elements with every class in target_class (e.g. 'browse-link roboto').
+    NOTE This is what the 'a.browse-link.roboto' CSS selector does, without needing cssselect.
+    """
+    conditions = " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {class_} ')" for class_ in target_class.split()
+    )
+    return f"//a[{conditions}]"
+
+
+def extract_urls_from_html(html: str | bytes, url: str, target_class: str) -> list[dict[str,str]]:
+    """
+    Extract URLs and their text from a page's raw HTML, without a browser.
+    Only works if the site puts its links in the HTML from the server, rather than rendering them with JavaScript.
+
+    Args:
+        html (str | bytes): The page's HTML.
+        url (str): The page's URL. Relative links are made absolute against it, like a.href does in the browser.
+        target_class (str): The class or classes of the links to get, as they're written in LEGAL_WEBSITE_DICT.
+
+    Returns:
+        A list of dictionaries with the href and text of each link. Empty if there are no matching links.
+
+    Example:
+        >>> extract_urls_from_html('<a class="codeLink" href="/AB1234">Town of Example</a>', "https://ecode360.com/", "codeLink")
+        [{'href': 'https://ecode360.com/AB1234', 'text': 'Town of Example'}]
+    """
+    if not html or not html.strip(): # NOTE lxml raises ParserError on an empty document.
+        return []
+    doc = lxml.html.fromstring(html)
+    doc.make_links_absolute(url)
+    return [
+        {"href": a.get("href"), "text": a.text_content().strip()}
+        for a in doc.xpath(_make_class_xpath(target_class))
+    ]
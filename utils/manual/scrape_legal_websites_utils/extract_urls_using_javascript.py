@@ -1,6 +1,6 @@
 
 import os
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from config.config import GOOGLE_SEARCH_RESULT_TAG, DEBUG_FILEPATH, LEGAL_WEBSITE_DICT
 from logger.logger import Logger
@@ -9,7 +9,9 @@ from utils.shared.safe_format import safe_format
 from utils.shared.sanitize_filename import sanitize_filename
 
 from playwright.async_api import Page as AsyncPlaywrightPage
-from playwright.sync_api import Page as PlaywrightPage
+if TYPE_CHECKING:
+    # NOTE The sync API is only needed for type hints. Importing it at runtime loads greenlet and the sync bridge.
+    from playwright.sync_api import Page as PlaywrightPage
 
 
 log_level=10
@@ -52,7 +54,7 @@ def safe_format_js_selector(source: str, js_command: str=None, args: dict[str,An
 
 
 
-async def extract_urls_using_javascript(page: PlaywrightPage, source: str) -> list[dict[str,str]] | list[None]:
+async def extract_urls_using_javascript(page: 'PlaywrightPage', source: str) -> list[dict[str,str]] | list[None]:
     """
     Use javascript to extract URLs and associated text from a webpage.
 
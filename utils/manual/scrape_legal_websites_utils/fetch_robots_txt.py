@@ -1,21 +1,63 @@
 
 
+import asyncio
+import functools
+
 import aiohttp
 import requests
 from urllib.parse import ParseResult, urlparse
 
+# Maximum number of robots.txt files fetched at once by fetch_many_robots_txt.
+MAX_CONCURRENT_ROBOTS_TXT_FETCHES = 10
+
+@functools.lru_cache(maxsize=1024)
 def _make_robots_txt_url(url: str) -> str:
     parsed_url: ParseResult = urlparse(url)
     base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
     return f"{base_url}/robots.txt"
 
-async def async_fetch_robots_txt(url: str) -> str:
+async def async_fetch_robots_txt(url: str, session: aiohttp.ClientSession=None) -> str:
+    """
+    Fetch the robots.txt for a URL's site.
+
+    Args:
+        url (str): Any URL on the site.
+        session (aiohttp.ClientSession, Optional): A session to reuse for the request.
+            If not given, a new session is opened and closed for this request only.
+
+    Returns:
+        str: The text of the robots.txt, or an empty string if it could not be fetched.
+    """
     robots_url = _make_robots_txt_url(url)
-    async with aiohttp.ClientSession() as session:
+    close_session = session is None
+    session = session or aiohttp.ClientSession()
+    try:
         async with session.get(robots_url) as response:
             if response.status == 200:
                 return await response.text()
             return ""
+    finally:
+        if close_session:
+            await session.close()
+
+async def fetch_many_robots_txt(urls: list[str], max_concurrent: int=MAX_CONCURRENT_ROBOTS_TXT_FETCHES) -> list[str]:
+    """
+    Fetch the robots.txt files for several URLs over one shared session.
+
+    Args:
+        urls (list[str]): URLs on the sites to get robots.txt files for.
+        max_concurrent (int, Optional): The maximum number of fetches in flight at once.
+            Defaults to MAX_CONCURRENT_ROBOTS_TXT_FETCHES.
+
+    Returns:
+        list[str]: The robots.txt texts, in the same order as the input URLs.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    async with aiohttp.ClientSession() as session:
+        async def _fetch(url: str) -> str:
+            async with semaphore:
+                return await async_fetch_robots_txt(url, session=session)
+        return await asyncio.gather(*[_fetch(url) for url in urls])
 
 async def fetch_robots_txt(url: str) -> str:
     robots_url = _make_robots_txt_url(url)
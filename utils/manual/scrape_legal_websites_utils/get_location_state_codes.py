@@ -0,0 +1,26 @@
+import pandas as pd
+
+from database.database import MySqlDatabase
+
+async def get_location_state_codes(db: MySqlDatabase) -> list[str]:
+    """
+    Fetches the state codes that have locations in the database.
+    NOTE This is much smaller and quicker than get_locations, so the scrapers can build their URLs and start
+    while the full locations table is still being read.
+
+    Args:
+        db: MySqlDatabase instance for executing queries.
+    Returns:
+        A list of state codes, e.g. ['AL', 'AK', 'AR']
+    Examples:
+    >>> state_codes = await get_location_state_codes(db)
+    >>> state_codes[:3]
+    ['AL', 'AK', 'AR']
+    """
+    command = """
+        SELECT DISTINCT state_code FROM locations;
+        """
+    state_codes_df: pd.DataFrame = await db.async_query_to_dataframe(command)
+    if state_codes_df.empty:
+        return []
+    return state_codes_df['state_code'].tolist()
@@ -23,5 +23,9 @@ async def get_locations(db: MySqlDatabase) -> pd.DataFrame:
     command = """
         SELECT gnis, place_name, class_code, state_code FROM locations;
         """
-    locations_df: pd.DataFrame = await db.async_query_to_dataframe(command)
+    # NOTE The table is streamed in Arrow-backed chunks, so the whole result set is never held as Python objects at once.
+    chunks = [chunk async for chunk in db.async_query_to_dataframe_chunks(command, dtype_backend="pyarrow")]
+    if not chunks:
+        return pd.DataFrame(columns=["gnis", "place_name", "class_code", "state_code"])
+    locations_df: pd.DataFrame = pd.concat(chunks, ignore_index=True)
     return locations_df
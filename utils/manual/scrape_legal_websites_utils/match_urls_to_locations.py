@@ -11,14 +11,24 @@ from logger.logger import Logger
 
 logger = Logger(logger_name=__name__, stacklevel=3)
 
-def _remove_non_places(text: str):
-    non_places = (
-        "district", "codes", "tribe", "code", "comission", "jury", "system",  "council"
-    )
-    if any(non_places) in text.lower():
+NON_PLACES = (
+    "district", "codes", "tribe", "code", "comission", "jury", "system",  "council"
+)
+# NOTE Single words are looked up in a set of the text's words,
+# while multi-word terms still need a substring check.
+_SINGLE_WORD_NON_PLACES = frozenset(non_place for non_place in NON_PLACES if " " not in non_place)
+_MULTI_WORD_NON_PLACES = tuple(non_place for non_place in NON_PLACES if " " in non_place)
+# The columns of match_urls_to_locations' output.
+MATCHED_URL_COLUMNS = ["gnis", "href", "state_code", "source"]
+
+# NOTE Words are split on anything that isn't a word character, so punctuation (e.g. 'District,') doesn't hide them.
+_WORD_REGEX = re.compile(r"\w+")
+
+def _remove_non_places(text: str) -> bool:
+    lower_text = text.lower()
+    if _SINGLE_WORD_NON_PLACES.intersection(_WORD_REGEX.findall(lower_text)):
         return True
-    else:
-        return False
+    return any(non_place in lower_text for non_place in _MULTI_WORD_NON_PLACES)
 
 
 def _is_place_in_text(place_name: str, class_code:str,  text: str) -> bool:
@@ -116,8 +126,9 @@ def match_urls_to_locations(location_df: pd.DataFrame, site_df: pd.DataFrame) ->
     """
 
     # Filter site_df of non-places (e.g. Water District, Building Codes, etc.)
-    places_df = site_df[site_df['text'].apply(lambda text: _remove_non_places(text))]
-    non_places_df = site_df[~site_df['text'].apply(lambda text: _remove_non_places(text))]
+    non_places_mask = site_df['text'].apply(_remove_non_places)
+    places_df = site_df[~non_places_mask]
+    non_places_df = site_df[non_places_mask]
 
     # Save the non-places to a CSV file.
     non_places_df_csv_path = os.path.join(OUTPUT_FOLDER,"non_places_df.csv")
@@ -129,7 +140,7 @@ def match_urls_to_locations(location_df: pd.DataFrame, site_df: pd.DataFrame) ->
     ]
 
     # Save unmatched entries to CSV for further review
-    output_df = pd.DataFrame.from_dict(output_list)
+    output_df = pd.DataFrame.from_records(output_list, columns=MATCHED_URL_COLUMNS)
     unmatched = output_df[~output_df['gnis'].isin(location_df['gnis'])]
     if not unmatched.empty:
         non_places_df_csv_path = os.path.join(OUTPUT_FOLDER,"non_places_df.csv")
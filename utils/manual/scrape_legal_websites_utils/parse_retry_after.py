@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+# How long to wait when a site rate-limits us without saying for how long.
+DEFAULT_RETRY_AFTER_IN_SECONDS = 60.0
+
+
+def parse_retry_after(retry_after: str | None, default: float=DEFAULT_RETRY_AFTER_IN_SECONDS) -> float:
+    """
+    Get the number of seconds to wait from a Retry-After header.
+    The header can either be a number of seconds or an HTTP date.
+
+    Args:
+        retry_after (str | None): The value of the Retry-After header, if there is one.
+        default (float, optional): Seconds to wait if the header is missing or can't be read. Defaults to 60.
+
+    Returns:
+        The number of seconds to wait. Never negative.
+
+    Example:
+        >>> parse_retry_after("120")
+        120.0
+        >>> parse_retry_after(None)
+        60.0
+    """
+    if not retry_after:
+        return default
+
+    retry_after = retry_after.strip()
+    if retry_after.isdigit():
+        return float(retry_after)
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
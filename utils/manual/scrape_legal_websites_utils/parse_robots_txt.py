@@ -1,79 +1,70 @@
 from typing import Any
 
-import urllib.robotparser
-from urllib.parse import urljoin
 
-def parse_robots_txt(robots_txt: str, current_agent: str) -> dict[str,dict[str,Any]]:
+def parse_robots_txt(robots_txt: str, current_agent: str="*") -> dict[str,dict[str,Any]]:
     """
     Parse a robots.txt file and return it as a dictionary.
     Args:
         robots_txt (str): The content of the robots.txt file.
-        current_agent (str): The default user agent to start with.
+        current_agent (str): The user agent that rules before the first User-agent line apply to. Defaults to '*'.
 
     Returns:
         dict[str, dict[str, Any]]: A dictionary containing the parsed rules for each user agent.
+            NOTE The allow and disallow rules are tuples, so can_fetch can cache its compiled patterns on them.
 
     Example:
     >>> example_rules = {
             '*': {
-                'allow': ['/public/', '/images/'],
-                'disallow': ['/private/', '/admin/'],
+                'allow': ('/public/', '/images/'),
+                'disallow': ('/private/', '/admin/'),
                 'crawl_delay': 5.0
             },
             'googlebot': {
-                'allow': ['/news/'],
-                'disallow': ['/search', '/login'],
+                'allow': ('/news/',),
+                'disallow': ('/search', '/login'),
                 'crawl_delay': 2.0
             },
             'bingbot': {
-                'allow': ['/blog/'],
-                'disallow': ['/members/'],
+                'allow': ('/blog/',),
+                'disallow': ('/members/',),
                 'crawl_delay': 3.5
             }}
     """
-    pass
-    # # Create a RobotFileParser object
-    # rp = urllib.robotparser.RobotFileParser()
-    
-    # # Construct the URL to the robots.txt file
-    # robots_url = urljoin(robots, 'robots.txt')
-    # rp.set_url(self.robot_txt_url)
-    
-    # # Read the robots.txt file from the server
-    # rp.read()
+    rules: dict[str, dict[str, Any]] = {current_agent: {'allow': [], 'disallow': [], 'crawl_delay': 0}}
+    agents: list[str] = [current_agent]
+    last_line_was_agent = False
 
+    for line in (robots_txt or "").splitlines():
+        line = line.split('#', 1)[0].strip() # Drop comments.
+        if ':' not in line:
+            continue
+        directive, value = (part.strip() for part in line.split(':', 1))
+        directive = directive.lower()
 
+        if directive == 'user-agent':
+            # NOTE Consecutive User-agent lines share the group of rules that follows them.
+            if not last_line_was_agent:
+                agents = []
+            agent = value.lower()
+            agents.append(agent)
+            rules.setdefault(agent, {'allow': [], 'disallow': [], 'crawl_delay': 0})
+            last_line_was_agent = True
+            continue
+        last_line_was_agent = False
 
-    # rules: dict[str, dict[str, Any]] = {current_agent: {'allow': [], 'disallow': [], 'crawl_delay': 0}}
-    # directives: dict[str, tuple[str, ...]] = {
-    #     'user_agent': ('user-agent:', 'User-agent:'),
-    #     'allow': ('allow:', 'Allow:'),
-    #     'disallow': ('disallow:', 'Disallow:'),
-    #     'crawl_delay': ('crawl-delay:', 'Crawl-delay:')
-    # }
-    # rules = {}
-    # robots_txt_list = [
-    #     line.lower().strip() for line in robots_txt.splitlines() if not line or line.startswith('#')
-    # ]
-    # for line in robots_txt_list:
-    #     if line.startswith('user-agent'): # Add a user agent to the dictionary.
-    #         user_agent = line.split(':', 1)[1].strip()
-    #         rules[user_agent] = {} if user_agent not in rules
-    #         rules[line.split(':', 1)[1].strip()]
-    #         rules['user_agent'] = 
+        if directive in ('allow', 'disallow'):
+            if value: # An empty Disallow means everything is allowed, so there's nothing to add.
+                for agent in agents:
+                    rules[agent][directive].append(value)
+        elif directive == 'crawl-delay':
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            for agent in agents:
+                rules[agent]['crawl_delay'] = delay
 
-
-    # for directive, prefixes in directives.items():
-    #     if line.lower().startswith(prefixes):
-    #         value = line.split(':', 1)[1].strip()
-    #         if directive == 'user_agent':
-    #             current_agent = value.lower()
-    #             if current_agent not in rules:
-    #                 rules[current_agent] = {'allow': [], 'disallow': [], 'crawl_delay': 0}
-    #         elif directive == 'crawl_delay':
-    #             rules[current_agent]['crawl_delay'] = float(value)
-    #         else:
-    #             rules[current_agent][directive].append(value)
-    #         break
-
-    # return rules
+    return {
+        agent: {**agent_rules, 'allow': tuple(agent_rules['allow']), 'disallow': tuple(agent_rules['disallow'])}
+        for agent, agent_rules in rules.items()
+    }
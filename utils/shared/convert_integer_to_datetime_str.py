@@ -1,4 +1,3 @@
-from datetime import datetime
 
 def convert_integer_to_datetime_str(integer: int) -> str:
     """
@@ -7,16 +6,15 @@ def convert_integer_to_datetime_str(integer: int) -> str:
     >>> result = convert_integer_to_datetime_str(integer_input)
     '2024-08-02 12:13:08'
     """
+    assert 10**13 <= integer < 10**14, f"len(str(integer)) is not 14, but '{len(str(integer))}', so it cannot be converted to YYYY-MM-DD hh:mm:ss format"
 
-    # Convert the integer to a string
-    date_string = str(integer)
-    assert len(date_string) == 14, f"len(date_string) is not 14, but '{len(date_string)}', so it cannot be converted to YYYY-MM-DD hh:mm:ss format"
-    
-    # Parse the string into a datetime object
-    dt = datetime.strptime(date_string, "%Y%m%d%H%M%S")
-    
-    # Format the datetime object into the desired string format
-    formatted_date = dt.strftime("%Y-%m-%d %H:%M:%S")
-    
-    return formatted_date
+    # Split the integer into its YYYYMMDDhhmmss fields with integer arithmetic.
+    # NOTE This skips parsing and re-formatting through a datetime object,
+    # so field values (e.g. a 13th month) are no longer validated.
+    integer, second = divmod(integer, 100)
+    integer, minute = divmod(integer, 100)
+    integer, hour = divmod(integer, 100)
+    integer, day = divmod(integer, 100)
+    year, month = divmod(integer, 100)
 
+    return f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
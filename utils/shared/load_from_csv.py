@@ -1,43 +1,38 @@
-import csv
+import pandas as pd
 
 from logger.logger import Logger
 
 logger = Logger(logger_name=__name__)
 
-def load_from_csv(filename: str) -> list[dict]:
+def load_from_csv(filename: str, return_df: bool=False) -> list[dict] | pd.DataFrame:
     """
     Load data from a CSV file and return it as a list of dictionaries.
 
     Each row in the CSV is converted to a dictionary, with column names as keys.
+    All values are loaded as strings, and empty cells are loaded as empty strings.
 
-    NOTE: This function explicitly skips the header row.
     Args:
         filename (str): The path to the CSV file to be loaded.
+        return_df (bool, Optional): Whether to return the data as a pandas DataFrame instead of a list of dictionaries.
+            This skips building a dictionary for every row. Defaults to False.
 
     Returns:
         list[dict]: A list of dictionaries, where each dictionary represents a row
         from the CSV file. Returns an empty list if the file is not found or if
         there's an error reading the CSV.
+        pd.DataFrame: If return_df is True. Returns an empty DataFrame on errors instead.
 
-    Raises:
-        FileNotFoundError: If the specified file doesn't exist.
-        csv.Error: If there's an error reading the CSV file.
     Examples:
     >>> load_from_csv('data/sample-data.csv')
     [{"shrek": "is_love", "number": 69},{"shrek": "is_life", "number": 420}]
     """
     try:
         logger.debug(f"filename: {filename}")
-        with open(filename, 'r', newline='') as input_file:
-            dict_reader = csv.DictReader(input_file)
-            next(dict_reader)  # Skip the header row
-            data = list(dict_reader)
-
+        df = pd.read_csv(filename, dtype=str, keep_default_na=False, engine='c')
         logger.info(f"Data loaded from {filename}")
-        return data
+        return df if return_df else df.to_dict('records')
     except FileNotFoundError:
         logger.error(f"File {filename} not found.")
-        return []
-    except csv.Error as e:
+    except (pd.errors.ParserError, pd.errors.EmptyDataError) as e:
         logger.error(f"Error reading CSV file {filename}: {e}")
-        return []
+    return pd.DataFrame() if return_df else []
@@ -1,9 +1,37 @@
 import csv
 
+try:
+    # NOTE pyarrow writes the whole table with its C++ CSV writer.
+    # If it's not installed, we fall back to csv.DictWriter.
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
 from logger.logger import Logger
 
 logger = Logger(logger_name=__name__)
 
+def _save_dicts_with_pyarrow(data: list[dict], filepath: str) -> bool:
+    """
+    Write a list of dictionaries to a CSV file through a pyarrow Table.
+    Returns False if pyarrow is not installed, or can't build or write a table from the data (e.g. list values).
+    NOTE pyarrow quotes every header and writes bools as true/false, unlike csv.DictWriter.
+    """
+    if pa is None:
+        return False
+    # NOTE pyarrow takes its columns from the first row only, so rows with other keys go through csv.DictWriter,
+    # which raises on them instead of dropping their values.
+    keys = data[0].keys()
+    if any(row.keys() != keys for row in data):
+        return False
+    try:
+        pa_csv.write_csv(pa.Table.from_pylist(data), filepath)
+    except pa.ArrowException as e:
+        logger.debug(f"Could not write data with pyarrow: {e}. Falling back to csv.DictWriter...")
+        return False
+    return True
+
 def save_to_csv(data: list[dict] | list[str], filepath: str) -> None:
     """
     Save a list of dictionaries or a list of strings to a CSV file.
@@ -12,6 +40,10 @@ def save_to_csv(data: list[dict] | list[str], filepath: str) -> None:
         logger.warning("No data to save.")
         return
 
+    if isinstance(data[0], dict) and _save_dicts_with_pyarrow(data, filepath): # List of dictionaries, pyarrow route.
+        logger.info(f"Data saved to {filepath}")
+        return
+
     with open(filepath, 'w', newline='') as output_file:
         if isinstance(data[0], dict): # List of dictionaries route.
             keys = data[0].keys()